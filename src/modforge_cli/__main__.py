@@ -2,23 +2,13 @@
 Main CLI entry point - Registers all commands
 """
 
+import contextlib
 import logging
+from pathlib import Path
 
-from pyfiglet import figlet_format
-from rich.panel import Panel
-from rich.text import Text
 import typer
 
-from modforge_cli.cli import export, modpack, project, setup, sklauncher, utils
-from modforge_cli.cli.shared import (
-    DEFAULT_MODRINTH_API_URL,
-    DEFAULT_POLICY_URL,
-    MODRINTH_API,
-    POLICY_PATH,
-    console,
-    get_version_info,
-)
-from modforge_cli.core import ensure_config_file, setup_crash_logging
+from modforge_cli.cli.shared import CACHE_PATH, FABRIC_LOADER_VERSION, console, get_version_info
 
 # Get version info
 __version__, __author__ = get_version_info()
@@ -29,22 +19,50 @@ app = typer.Typer(
     no_args_is_help=False,
 )
 
-# Setup crash logging
+# Crash logging runs on first use, not at import; configs are fetched by the
+# commands that read them
+_LOG_DIR: Path | None = None
+
+
+def _get_log_dir() -> Path:
+    """Install the crash handler once and return the log directory"""
+    global _LOG_DIR
+    if _LOG_DIR is None:
+        from modforge_cli.core import setup_crash_logging
 
+        _LOG_DIR = setup_crash_logging()
+    return _LOG_DIR
 
-LOG_DIR = setup_crash_logging()
 
-# Ensure configs exist
-ensure_config_file(MODRINTH_API, DEFAULT_MODRINTH_API_URL, "Modrinth API", console)
-ensure_config_file(POLICY_PATH, DEFAULT_POLICY_URL, "Policy", console)
+def _banner_art(font: str) -> str:
+    """Figlet art for the banner, cached on disk per version and font"""
+    cache_file = CACHE_PATH / f"banner-v{__version__}-{font}.txt"
+    cached = ""
+    with contextlib.suppress(OSError):
+        cached = cache_file.read_text(encoding="utf-8")
+    # An empty file is a truncated write; regenerate it
+    if cached:
+        return cached
+
+    from pyfiglet import figlet_format
+
+    # pyfiglet is untyped; annotate its str result
+    ascii_art: str = figlet_format("ModForge-CLI", font=font)
+    with contextlib.suppress(OSError):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(ascii_art, encoding="utf-8")
+    return ascii_art
 
 
 def render_banner() -> None:
     """Renders a stylized banner"""
+    from rich.panel import Panel
+    from rich.text import Text
+
     width = console.width
     font = "slant" if width > 60 else "small"
 
-    ascii_art = figlet_format("ModForge-CLI", font=font)
+    ascii_art = _banner_art(font)
     banner_text = Text(ascii_art, style="bold cyan")
 
     info_line = Text.assemble(
@@ -80,7 +98,7 @@ def main_callback(
             level=logging.DEBUG,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             handlers=[
-                logging.FileHandler(LOG_DIR / f"modforge-{__version__}.log"),
+                logging.FileHandler(_get_log_dir() / f"modforge-{__version__}.log"),
                 logging.StreamHandler(),
             ],
         )
@@ -91,36 +109,130 @@ def main_callback(
 
     if ctx.invoked_subcommand is None:
         render_banner()
-        console.print("\n[bold yellow]Usage:[/bold yellow] ModForge-CLI [COMMAND] [ARGS]...")
-        console.print("\n[bold cyan]Core Commands:[/bold cyan]")
-        console.print("  [green]setup[/green]       Initialize a new modpack project")
-        console.print("  [green]ls[/green]          List all registered projects")
-        console.print("  [green]add[/green]         Add a mod/resource/shader to manifest")
-        console.print("  [green]resolve[/green]     Resolve all dependencies")
-        console.print("  [green]build[/green]       Download files and setup loader")
-        console.print("  [green]export[/green]      Create the final .mrpack")
-        console.print("  [green]validate[/green]    Check .mrpack for issues")
-        console.print("  [green]sklauncher[/green]  Create SKLauncher profile (no .mrpack)")
-        console.print("  [green]remove[/green]      Remove a modpack project")
-        console.print("\n[bold cyan]Utility:[/bold cyan]")
-        console.print("  [green]self-update[/green] Update ModForge-CLI")
-        console.print("  [green]doctor[/green]      Validate installation")
-        console.print("\nRun [white]ModForge-CLI --help[/white] for details.\n")
-
-
-# Register all command groups
-app.command()(setup.setup)
-app.add_typer(project.app, name="project", help="Project management commands")
-app.command("ls")(project.list_projects)
-app.command()(project.remove)
-app.command()(modpack.add)
-app.command()(modpack.resolve)
-app.command()(modpack.build)
-app.command()(export.export)
-app.command()(export.validate)
-app.command()(sklauncher.sklauncher)
-app.command()(utils.doctor)
-app.command("self-update")(utils.self_update_cmd)
+        console.print(
+            "\n[bold yellow]Usage:[/bold yellow] ModForge-CLI [COMMAND] [ARGS]...\n"
+            "\n[bold cyan]Core Commands:[/bold cyan]\n"
+            "  [green]setup[/green]       Initialize a new modpack project\n"
+            "  [green]ls[/green]          List all registered projects\n"
+            "  [green]add[/green]         Add a mod/resource/shader to manifest\n"
+            "  [green]resolve[/green]     Resolve all dependencies\n"
+            "  [green]build[/green]       Download files and setup loader\n"
+            "  [green]export[/green]      Create the final .mrpack\n"
+            "  [green]validate[/green]    Check .mrpack for issues\n"
+            "  [green]sklauncher[/green]  Create SKLauncher profile (no .mrpack)\n"
+            "  [green]remove[/green]      Remove a modpack project\n"
+            "\n[bold cyan]Utility:[/bold cyan]\n"
+            "  [green]self-update[/green] Update ModForge-CLI\n"
+            "  [green]doctor[/green]      Validate installation\n"
+            "\nRun [white]ModForge-CLI --help[/white] for details.\n"
+        )
+        return
+
+    _get_log_dir()
+
+
+# Register all commands. Each command is a thin wrapper that imports its
+# implementation on first use, so unrelated commands cost nothing at startup.
+# The wrappers are the only Typer declarations: options and defaults live here.
+project_app = typer.Typer()
+
+
+@app.command()
+def setup(
+    name: str,
+    mc: str = "1.21.1",
+    loader: str = "fabric",
+    loader_version: str = FABRIC_LOADER_VERSION,
+) -> None:
+    """Initialize a new modpack project"""
+    from modforge_cli.cli.setup import setup as setup_cmd
+
+    setup_cmd(name, mc, loader, loader_version)
+
+
+@project_app.command(name="ls")
+@app.command("ls")
+def list_projects() -> None:
+    """List all registered modpacks"""
+    from modforge_cli.cli.project import list_projects as list_projects_cmd
+
+    list_projects_cmd()
+
+
+@project_app.command()
+@app.command()
+def remove(pack_name: str) -> None:
+    """Remove a modpack and unregister it"""
+    from modforge_cli.cli.project import remove as remove_cmd
+
+    remove_cmd(pack_name)
+
+
+@app.command()
+def add(name: str, project_type: str = "mod", pack_name: str | None = None) -> None:
+    """Add a project to the manifest"""
+    from modforge_cli.cli.modpack import add as add_cmd
+
+    add_cmd(name, project_type, pack_name)
+
+
+@app.command()
+def resolve(pack_name: str | None = None) -> None:
+    """Resolve all mod dependencies"""
+    from modforge_cli.cli.modpack import resolve as resolve_cmd
+
+    resolve_cmd(pack_name)
+
+
+@app.command()
+def build(pack_name: str | None = None) -> None:
+    """Download all mods and dependencies"""
+    from modforge_cli.cli.modpack import build as build_cmd
+
+    build_cmd(pack_name)
+
+
+@app.command()
+def export(pack_name: str | None = None) -> None:
+    """Create final .mrpack file"""
+    from modforge_cli.cli.export import export as export_cmd
+
+    export_cmd(pack_name)
+
+
+@app.command()
+def validate(mrpack_file: str | None = None) -> None:
+    """Validate .mrpack file for launcher compatibility"""
+    from modforge_cli.cli.export import validate as validate_cmd
+
+    validate_cmd(mrpack_file)
+
+
+@app.command()
+def sklauncher(pack_name: str | None = None, profile_name: str | None = None) -> None:
+    """Create SKLauncher-compatible profile (alternative to export)"""
+    from modforge_cli.cli.sklauncher import sklauncher as sklauncher_cmd
+
+    sklauncher_cmd(pack_name, profile_name)
+
+
+@app.command()
+def doctor() -> None:
+    """Validate ModForge-CLI installation"""
+    from modforge_cli.cli.utils import doctor as doctor_cmd
+
+    doctor_cmd()
+
+
+@app.command("self-update")
+def self_update_cmd() -> None:
+    """Update ModForge-CLI to latest version"""
+    from modforge_cli.cli.utils import self_update_cmd as self_update
+
+    self_update()
+
+
+app.add_typer(project_app, name="project", help="Project management commands")
 
 
 def main() -> None:
@@ -6,8 +6,11 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.parse import quote_plus
+from string import Formatter
+from typing import Any
+from urllib.parse import quote_plus, urlencode
+
+from modforge_cli import jsonio
 
 
 class ModrinthAPIConfig:
@@ -15,25 +18,81 @@ class ModrinthAPIConfig:
 
     def __init__(self, config_path: str | Path = "configs/modrinth_api.json"):
         self.config_path = config_path if isinstance(config_path, Path) else Path(config_path)
-        self.base_url: str = ""
-        self.endpoints: Dict[str, Any] = {}
-        self._load_config()
+        # Loaded on first access so constructing the client costs no I/O
+        self._base_url: str | None = None
+        self._endpoints: dict[str, Any] = {}
+        # Flattened "group.name" -> absolute URL template, built once on load
+        self._templates: dict[str, str] = {}
+        # Templates whose only placeholder is {id}, pre-split as (prefix, suffix)
+        self._id_templates: dict[str, tuple[str, str]] = {}
+
+    @property
+    def base_url(self) -> str:
+        if self._base_url is None:
+            self._load_config()
+        return self._base_url  # type: ignore[return-value]
+
+    @property
+    def endpoints(self) -> dict[str, Any]:
+        if self._base_url is None:
+            self._load_config()
+        return self._endpoints
 
     def _load_config(self) -> None:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Modrinth API config not found: {self.config_path}")
 
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.loads(self.config_path.read_bytes())
 
-        self.base_url = data.get("BASE_URL", "").rstrip("/")
-        if not self.base_url:
+        base_url = data.get("BASE_URL", "").rstrip("/")
+        if not base_url:
             raise ValueError("BASE_URL missing in modrinth_api.json")
 
-        self.endpoints = data.get("ENDPOINTS", {})
-        if not isinstance(self.endpoints, Dict):
+        endpoints = data.get("ENDPOINTS", {})
+        if not isinstance(endpoints, dict):
             raise ValueError("ENDPOINTS section is invalid")
 
+        self._templates = {}
+        self._id_templates = {}
+        self._flatten_endpoints(endpoints, base_url, "")
+
+        self._base_url = base_url
+        self._endpoints = endpoints
+
+    def _flatten_endpoints(self, node: dict[str, Any], base_url: str, prefix: str) -> None:
+        for key, value in node.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, dict):
+                self._flatten_endpoints(value, base_url, f"{name}.")
+                continue
+
+            template = f"{base_url}{value}"
+            self._templates[name] = template
+
+            fields = [field for _, field, _, _ in Formatter().parse(template) if field is not None]
+            if fields == ["id"]:
+                head, _, tail = template.partition("{id}")
+                self._id_templates[name] = (head, tail)
+
+    def _format(self, key: str, **kwargs: str) -> str:
+        """Format the flattened endpoint template registered under key."""
+        if self._base_url is None:
+            self._load_config()
+        template = self._templates[key]
+        try:
+            return template.format(**kwargs)
+        except KeyError as e:
+            raise ValueError(f"Missing URL parameter: {e}") from e
+
+    def _format_id(self, key: str, id_: str) -> str:
+        """Fast path for {id}-only endpoints: plain concatenation, no format()."""
+        if self._base_url is None:
+            self._load_config()
+        parts = self._id_templates.get(key)
+        if parts is None:
+            return self._format(key, id=id_)
+        return parts[0] + id_ + parts[1]
+
     def build_url(self, template: str, **kwargs: str) -> str:
         """Format a template string with kwargs and prepend base URL."""
         try:
@@ -46,23 +105,23 @@ class ModrinthAPIConfig:
 
     def search(
         self,
-        query: Optional[str] = None,
-        facets: Optional[List[List[str]] | str] = None,
-        categories: Optional[List[str]] = None,
-        loaders: Optional[List[str]] = None,
-        game_versions: Optional[List[str]] = None,
-        license_: Optional[str] = None,
-        project_type: Optional[str] = None,
-        offset: Optional[int] = None,
-        limit: Optional[int] = 10,
-        index: Optional[str] = "relevance",
+        query: str | None = None,
+        facets: list[list[str]] | str | None = None,
+        categories: list[str] | None = None,
+        loaders: list[str] | None = None,
+        game_versions: list[str] | None = None,
+        license_: str | None = None,
+        project_type: str | None = None,
+        offset: int | None = None,
+        limit: int | None = 10,
+        index: str | None = "relevance",
     ) -> str:
         """
         Build the Modrinth search URL with query parameters.
 
         Docs: https://docs.modrinth.com/api-spec#endpoints-search
 
-        Facets format: [[inner AND], [inner AND]] = outer OR
+        Facets format: [[inner OR], [inner OR]] = outer AND
         Example: [["categories:performance"], ["project_type:mod"]]
 
         Args:
@@ -80,23 +139,24 @@ class ModrinthAPIConfig:
         Returns:
             Full search URL with query parameters
         """
-        base = self.build_url(self.endpoints["search"])
-        params = []
+        base = self._format("search")
+        params: list[tuple[str, Any]] = []
         if query:
-            params.append(f"query={quote_plus(query)}")
+            params.append(("query", query))
 
-        facets_array = []
-        if facets:
-            if isinstance(facets, str):
-                params.append(f"facets={quote_plus(facets)}")
-            else:
-                facets_array.extend(facets)
+        if isinstance(facets, str):
+            params.append(("facets", facets))
+        facets_array: list[list[str]] = (
+            list(facets) if facets and not isinstance(facets, str) else []
+        )
 
         if project_type:
             facets_array.append([f"project_type:{project_type}"])
         if categories:
-            [facets_array.append([f"categories:{c}"]) for c in categories]
+            # Every category must match: one AND group each
+            facets_array.extend([f"categories:{c}"] for c in categories)
         if loaders:
+            # Any listed loader may match: a single OR group
             facets_array.append([f"categories:{l}" for l in loaders])
         if game_versions:
             facets_array.append([f"versions:{v}" for v in game_versions])
@@ -104,107 +164,120 @@ class ModrinthAPIConfig:
             facets_array.append([f"license:{license_}"])
 
         if facets_array and not (isinstance(facets, str)):
-            params.append(f"facets={quote_plus(json.dumps(facets_array))}")
+            params.append(("facets", json.dumps(facets_array, separators=(",", ":"))))
 
         if offset is not None:
-            params.append(f"offset={offset}")
+            params.append(("offset", offset))
         if limit is not None:
-            params.append(f"limit={min(limit, 100)}")
+            params.append(("limit", min(limit, 100)))
         if index:
-            params.append(f"index={index}")
+            params.append(("index", index))
 
-        return f"{base}?{'&'.join(params)}" if params else base
+        return f"{base}?{urlencode(params, quote_via=quote_plus)}" if params else base
 
     # === Projects ===
 
     def project(self, project_id: str) -> str:
-        return self.build_url(self.endpoints["projects"]["project"], id=project_id)
+        return self._format_id("projects.project", project_id)
 
-    def project_versions(self, project_id: str) -> str:
-        return self.build_url(self.endpoints["projects"]["project_versions"], id=project_id)
+    def project_versions(
+        self,
+        project_id: str,
+        loaders: list[str] | None = None,
+        game_versions: list[str] | None = None,
+    ) -> str:
+        """Versions of a project, optionally filtered server-side by loader/game version"""
+        base = self._format_id("projects.project_versions", project_id)
+        params: list[tuple[str, str]] = []
+        if loaders:
+            params.append(("loaders", json.dumps(loaders, separators=(",", ":"))))
+        if game_versions:
+            params.append(("game_versions", json.dumps(game_versions, separators=(",", ":"))))
+        return f"{base}?{urlencode(params, quote_via=quote_plus)}" if params else base
 
     def project_dependencies(self, project_id: str) -> str:
-        return self.build_url(self.endpoints["projects"]["dependencies"], id=project_id)
+        return self._format_id("projects.dependencies", project_id)
 
     def project_gallery(self, project_id: str) -> str:
-        return self.build_url(self.endpoints["projects"]["gallery"], id=project_id)
+        return self._format_id("projects.gallery", project_id)
 
     def project_icon(self, project_id: str) -> str:
-        return self.build_url(self.endpoints["projects"]["icon"], id=project_id)
+        return self._format_id("projects.icon", project_id)
 
     def check_following(self, project_id: str) -> str:
-        return self.build_url(self.endpoints["projects"]["check_following"], id=project_id)
+        return self._format_id("projects.check_following", project_id)
 
     # === Versions ===
 
     def version(self, version_id: str) -> str:
-        return self.build_url(self.endpoints["versions"]["version"], id=version_id)
+        return self._format_id("versions.version", version_id)
 
     def version_files(self, version_id: str) -> str:
-        return self.build_url(self.endpoints["versions"]["files"], id=version_id)
+        return self._format_id("versions.files", version_id)
 
     def version_file_download(self, version_id: str, filename: str) -> str:
-        return self.build_url(
-            self.endpoints["versions"]["download"], id=version_id, filename=filename
-        )
+        return self._format("versions.download", id=version_id, filename=filename)
 
     def file_by_hash(self, hash_: str) -> str:
-        return self.build_url(self.endpoints["versions"]["file_by_hash"], hash=hash_)
+        return self._format("versions.file_by_hash", hash=hash_)
 
     def versions_by_hash(self, hash_: str) -> str:
-        return self.build_url(self.endpoints["versions"]["versions_by_hash"], hash=hash_)
+        return self._format("versions.versions_by_hash", hash=hash_)
 
     def latest_version_for_hash(self, hash_: str, algorithm: str = "sha1") -> str:
-        return self.build_url(
-            self.endpoints["versions"]["latest_for_hash"], hash=hash_, algo=algorithm
-        )
+        return self._format("versions.latest_for_hash", hash=hash_, algo=algorithm)
 
     # === Tags ===
 
     def categories(self) -> str:
-        return self.build_url(self.endpoints["tags"]["categories"])
+        return self._format("tags.categories")
 
     def loaders(self) -> str:
-        return self.build_url(self.endpoints["tags"]["loaders"])
+        return self._format("tags.loaders")
 
     def game_versions(self) -> str:
-        return self.build_url(self.endpoints["tags"]["game_versions"])
+        return self._format("tags.game_versions")
 
     def licenses(self) -> str:
-        return self.build_url(self.endpoints["tags"]["licenses"])
+        return self._format("tags.licenses")
 
     def environments(self) -> str:
-        return self.build_url(self.endpoints["tags"]["environments"])
+        return self._format("tags.environments")
 
     # === Teams ===
 
     def team(self, team_id: str) -> str:
-        return self.build_url(self.endpoints["teams"]["team"], id=team_id)
+        return self._format_id("teams.team", team_id)
 
     def team_members(self, team_id: str) -> str:
-        return self.build_url(self.endpoints["teams"]["members"], id=team_id)
+        return self._format_id("teams.members", team_id)
 
     # === User ===
 
     def user(self, user_id: str) -> str:
-        return self.build_url(self.endpoints["user"]["user"], id=user_id)
+        return self._format_id("user.user", user_id)
 
     def user_projects(self, user_id: str) -> str:
-        return self.build_url(self.endpoints["user"]["user_projects"], id=user_id)
+        return self._format_id("user.user_projects", user_id)
 
     def user_notifications(self, user_id: str) -> str:
-        return self.build_url(self.endpoints["user"]["notifications"], id=user_id)
+        return self._format_id("user.notifications", user_id)
 
     def user_avatar(self, user_id: str) -> str:
-        return self.build_url(self.endpoints["user"]["avatar"], id=user_id)
+        return self._format_id("user.avatar", user_id)
 
     # === Bulk ===
 
     def bulk_projects(self) -> str:
-        return self.build_url(self.endpoints["bulk"]["projects"])
+        return self._format("bulk.projects")
 
     def bulk_versions(self) -> str:
-        return self.build_url(self.endpoints["bulk"]["versions"])
+        return self._format("bulk.versions")
 
     def bulk_version_files(self) -> str:
-        return self.build_url(self.endpoints["bulk"]["version_files"])
+        return self._format("bulk.version_files")
+
+    def projects_bulk(self, ids: list[str]) -> str:
+        """GET /projects?ids=[...] - many projects (by ID or slug) in one request."""
+        query = urlencode({"ids": json.dumps(ids, separators=(",", ":"))}, quote_via=quote_plus)
+        return f"{self.bulk_projects()}?{query}"
@@ -1,7 +1,19 @@
 """
-Commands package - Exports all command groups
+Commands package - Implementations of the commands registered in __main__
+
+Submodules are imported lazily on first attribute access so that
+``--help``/``--version`` do not pay for every command's dependencies.
 """
 
-from . import export, modpack, project, setup, sklauncher, utils
+from importlib import import_module
+from types import ModuleType
 
 __all__ = ["setup", "project", "modpack", "export", "sklauncher", "utils"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        module = import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,27 +2,59 @@
 Export and validation commands
 """
 
-import json
+from collections.abc import Iterator
+import os
 from pathlib import Path
 import shutil
-import tempfile
+import time
+from typing import Any
 import zipfile
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
+from pydantic import ValidationError
 import typer
 
-from modforge_cli.cli.shared import REGISTRY_PATH, console
-from modforge_cli.core import get_manifest, load_registry
+from modforge_cli import jsonio
+from modforge_cli.cli.shared import REGISTRY_PATH, console, dir_nonempty, get_cwd
+from modforge_cli.core import IndexFile, IndexFileList, get_manifest, load_registry
+
+# Already-compressed formats gain nothing from DEFLATE; store them as-is
+STORED_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp", ".ogg", ".zip", ".jar", ".gz"})
+COPY_CHUNK_SIZE = 1 << 20
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield every file under root; scandir's d_type avoids a stat per directory entry"""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def _write_entry(zipf: ZipFile, entry: os.DirEntry[str], arcname: str) -> None:
+    """Add a file to the archive from its DirEntry, with a single stat"""
+    st = entry.stat()
+    zinfo = ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    if os.path.splitext(entry.name)[1].lower() in STORED_SUFFIXES:
+        zinfo.compress_type = ZIP_STORED
+    else:
+        zinfo.compress_type = ZIP_DEFLATED
+        # ZipInfo has no public compression level setter before Python 3.13
+        zinfo._compresslevel = zipf.compresslevel  # type: ignore[attr-defined]
 
-app = typer.Typer()
+    with open(entry.path, "rb") as src, zipf.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
 
 
-@app.command()
-def export(pack_name: str | None = None) -> None:
+def export(pack_name: str | None) -> None:
     """Create final .mrpack file"""
 
     if not pack_name:
-        manifest = get_manifest(console, Path.cwd())
+        manifest = get_manifest(console, get_cwd())
         if manifest:
             pack_name = manifest.name
         else:
@@ -44,7 +76,7 @@ def export(pack_name: str | None = None) -> None:
     mods_dir = pack_path / "mods"
     index_file = pack_path / "modrinth.index.json"
 
-    if not mods_dir.exists() or not any(mods_dir.iterdir()):
+    if not dir_nonempty(mods_dir):
         console.print("[red]No mods found. Run 'ModForge-CLI build' first[/red]")
         raise typer.Exit(1)
 
@@ -53,62 +85,48 @@ def export(pack_name: str | None = None) -> None:
         raise typer.Exit(1)
 
     # Validate index has files
-    index_data = json.loads(index_file.read_text())
+    index_data = jsonio.loads(index_file.read_bytes())
     if not index_data.get("files"):
         console.print("[yellow]Warning: No files registered in index[/yellow]")
         console.print("[yellow]This might cause issues. Run 'ModForge-CLI build' again.[/yellow]")
 
-    # Create .mrpack
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
+    # Create .mrpack, streaming files straight from the pack directory
+    overrides_src = pack_path / "overrides"
+    mrpack_path = pack_path.parent / f"{pack_name}.mrpack"
 
-        # Copy modrinth.index.json to root
-        shutil.copy2(index_file, tmp_path / "modrinth.index.json")
+    with ZipFile(mrpack_path, "w", ZIP_DEFLATED, compresslevel=1) as zipf:
+        # Add modrinth.index.json at root
+        zipf.write(index_file, "modrinth.index.json")
 
-        # Copy overrides if they exist
-        overrides_src = pack_path / "overrides"
+        # Add overrides folder if exists
         if overrides_src.exists():
-            overrides_dst = tmp_path / "overrides"
-            shutil.copytree(overrides_src, overrides_dst)
-            console.print("[green]✓ Copied overrides[/green]")
-
-        # Create .mrpack
-        mrpack_path = pack_path.parent / f"{pack_name}.mrpack"
-
-        with ZipFile(mrpack_path, "w", ZIP_DEFLATED) as zipf:
-            # Add modrinth.index.json at root
-            zipf.write(tmp_path / "modrinth.index.json", "modrinth.index.json")
+            for entry in _walk_files(str(overrides_src)):
+                rel = os.path.relpath(entry.path, pack_path)
+                _write_entry(zipf, entry, rel.replace(os.sep, "/"))
+            console.print("[green]✓ Added overrides[/green]")
 
-            # Add overrides folder if exists
-            if overrides_src.exists():
-                for file_path in (tmp_path / "overrides").rglob("*"):
-                    if file_path.is_file():
-                        arcname = str(file_path.relative_to(tmp_path))
-                        zipf.write(file_path, arcname)
+    console.print(f"[green bold]✓ Exported to {mrpack_path}[/green bold]")
 
-        console.print(f"[green bold]✓ Exported to {mrpack_path}[/green bold]")
+    # Show summary
+    file_count = len(index_data.get("files", []))
+    console.print("\n[cyan]Summary:[/cyan]")
+    console.print(f"  Files registered: {file_count}")
+    console.print(f"  Minecraft: {index_data['dependencies'].get('minecraft')}")
 
-        # Show summary
-        file_count = len(index_data.get("files", []))
-        console.print("\n[cyan]Summary:[/cyan]")
-        console.print(f"  Files registered: {file_count}")
-        console.print(f"  Minecraft: {index_data['dependencies'].get('minecraft')}")
+    # Show loader
+    for loader in ["fabric-loader", "quilt-loader", "forge", "neoforge"]:
+        if loader in index_data["dependencies"]:
+            console.print(f"  Loader: {loader} {index_data['dependencies'][loader]}")
 
-        # Show loader
-        for loader in ["fabric-loader", "quilt-loader", "forge", "neoforge"]:
-            if loader in index_data["dependencies"]:
-                console.print(f"  Loader: {loader} {index_data['dependencies'][loader]}")
+    console.print("\n[dim]Import this in SKLauncher, Prism, ATLauncher, etc.[/dim]")
 
-        console.print("\n[dim]Import this in SKLauncher, Prism, ATLauncher, etc.[/dim]")
 
-
-@app.command()
-def validate(mrpack_file: str | None = None) -> None:
+def validate(mrpack_file: str | None) -> None:
     """Validate .mrpack file for launcher compatibility"""
 
     if not mrpack_file:
         # Look for .mrpack in current directory
-        mrpacks = list(Path.cwd().glob("*.mrpack"))
+        mrpacks = list(get_cwd().glob("*.mrpack"))
         if not mrpacks:
             console.print("[red]No .mrpack file found in current directory[/red]")
             console.print("[yellow]Usage: ModForge-CLI validate <file.mrpack>[/yellow]")
@@ -123,22 +141,65 @@ def validate(mrpack_file: str | None = None) -> None:
 
     console.print(f"[cyan]Validating {mrpack_path.name}...[/cyan]\n")
 
+    # Buffer the report and flush it in one write instead of one per line
+    with console:
+        _validate_pack(mrpack_path)
+
+
+def _report_invalid_files(
+    error: ValidationError, files_list: list[Any], issues: list[str]
+) -> list[IndexFile]:
+    """
+    Report missing/invalid fields (with the offending entry indices) and return the
+    entries that did validate, so the hash and env checks still cover them
+    """
+    missing: dict[str, set[int]] = {}
+    invalid: dict[str, set[int]] = {}
+    bad: set[int] = set()
+    for err in error.errors():
+        loc = err["loc"]
+        if not loc or not isinstance(loc[0], int):
+            continue
+        bad.add(loc[0])
+        # A non-object entry fails as a whole, with no field in its location
+        field = str(loc[1]) if len(loc) > 1 else "entry"
+        target = missing if err["type"] == "missing" else invalid
+        target.setdefault(field, set()).add(loc[0])
+
+    for fields, issue, label in (
+        (missing, "Files missing fields", "Files missing"),
+        (invalid, "Files have invalid fields", "Files invalid"),
+    ):
+        if not fields:
+            continue
+        names = sorted(fields)
+        indices = sorted(set().union(*fields.values()))
+        issues.append(f"{issue}: {names} (entries {indices})")
+        console.print(
+            f"[red]❌ {label}: {', '.join(names)} (entries {', '.join(map(str, indices))})[/red]"
+        )
+
+    return [IndexFile.model_validate(f) for i, f in enumerate(files_list) if i not in bad]
+
+
+def _validate_pack(mrpack_path: Path) -> None:
+    """Run the .mrpack checks and print the report"""
     issues = []
     warnings = []
 
     try:
         with zipfile.ZipFile(mrpack_path, "r") as z:
-            files = z.namelist()
-
-            # Check for modrinth.index.json
-            if "modrinth.index.json" not in files:
+            # Check for modrinth.index.json (dict lookup, no namelist copy)
+            try:
+                index_info = z.getinfo("modrinth.index.json")
+            except KeyError:
                 console.print("[red]❌ CRITICAL: modrinth.index.json not found at root[/red]")
-                raise typer.Exit(1)
+                raise typer.Exit(1) from None
 
             console.print("[green]✅ modrinth.index.json found[/green]")
 
-            # Read and validate index
-            index_data = json.loads(z.read("modrinth.index.json"))
+            # Read and validate index; orjson parses the member bytes directly
+            index_data = jsonio.loads(z.read(index_info))
 
             # Check required fields
             required = ["formatVersion", "game", "versionId", "name", "dependencies"]
@@ -175,39 +236,42 @@ def validate(mrpack_file: str | None = None) -> None:
 
             # Check files array
             files_list = index_data.get("files", [])
-            console.print(f"\n[cyan]📦 Files registered: {len(files_list)}[/cyan]")
+            entries: list[IndexFile] = []
 
-            if len(files_list) == 0:
-                warnings.append("No files in array (pack might not work)")
-                console.print("[yellow]⚠️  WARNING: files array is empty[/yellow]")
+            if not isinstance(files_list, list):
+                issues.append("files is not an array")
+                console.print("[red]❌ files must be an array[/red]")
             else:
-                # Check first file structure
-                sample = files_list[0]
-                file_required = ["path", "hashes", "downloads", "fileSize"]
-
-                missing_fields = [f for f in file_required if f not in sample]
-                if missing_fields:
-                    issues.append(f"Files missing fields: {missing_fields}")
-                    console.print(f"[red]❌ Files missing: {', '.join(missing_fields)}[/red]")
+                console.print(f"\n[cyan]📦 Files registered: {len(files_list)}[/cyan]")
+
+                if len(files_list) == 0:
+                    warnings.append("No files in array (pack might not work)")
+                    console.print("[yellow]⚠️  WARNING: files array is empty[/yellow]")
                 else:
-                    console.print("[green]✅ File structure looks good[/green]")
+                    # Validate every entry in one pass through pydantic-core
+                    try:
+                        entries = IndexFileList.validate_python(files_list)
+                    except ValidationError as e:
+                        entries = _report_invalid_files(e, files_list, issues)
+                    else:
+                        console.print("[green]✅ File structure looks good[/green]")
 
+            if entries:
                 # Check hashes
-                if "hashes" in sample:
-                    if "sha1" not in sample["hashes"]:
-                        issues.append("Files missing sha1 hash")
-                        console.print("[red]❌ Missing sha1 hashes[/red]")
-                    else:
-                        console.print("[green]✅ sha1 hashes present[/green]")
+                if any("sha1" not in entry.hashes for entry in entries):
+                    issues.append("Files missing sha1 hash")
+                    console.print("[red]❌ Missing sha1 hashes[/red]")
+                else:
+                    console.print("[green]✅ sha1 hashes present[/green]")
 
-                    if "sha512" not in sample["hashes"]:
-                        warnings.append("Files missing sha512 hash")
-                        console.print("[yellow]⚠️  Missing sha512 hashes (optional)[/yellow]")
-                    else:
-                        console.print("[green]✅ sha512 hashes present[/green]")
+                if any("sha512" not in entry.hashes for entry in entries):
+                    warnings.append("Files missing sha512 hash")
+                    console.print("[yellow]⚠️  Missing sha512 hashes (optional)[/yellow]")
+                else:
+                    console.print("[green]✅ sha512 hashes present[/green]")
 
                 # Check env field
-                if "env" not in sample:
+                if any(entry.env is None for entry in entries):
                     warnings.append("Files missing env field")
                     console.print("[yellow]⚠️  Missing env field (recommended)[/yellow]")
                 else:
@@ -240,7 +304,7 @@ def validate(mrpack_file: str | None = None) -> None:
     except zipfile.BadZipFile:
         console.print("[red]❌ ERROR: Not a valid ZIP/MRPACK file[/red]")
         raise typer.Exit(1)
-    except json.JSONDecodeError as e:
+    except jsonio.JSONDecodeError as e:
         console.print("[red]❌ ERROR: Invalid JSON in modrinth.index.json[/red]")
         console.print(f"[dim]{e}[/dim]")
         raise typer.Exit(1)
\ No newline at end of file
@@ -2,31 +2,41 @@
 Modpack operations - Add, resolve, build
 """
 
-import asyncio
+from functools import cache
 from pathlib import Path
 
 import typer
 
 from modforge_cli.api import ModrinthAPIConfig
-from modforge_cli.cli.shared import MODRINTH_API, POLICY_PATH, REGISTRY_PATH, console
+from modforge_cli.cli.shared import (
+    DEFAULT_CONFIGS,
+    MODRINTH_API,
+    POLICY_PATH,
+    REGISTRY_PATH,
+    console,
+    get_cwd,
+)
 from modforge_cli.core import (
     ModPolicy,
     ModResolver,
-    get_api_session,
+    ensure_config_files,
     get_manifest,
     load_registry,
     perform_add,
     run,
+    run_with_session,
+    write_manifest,
 )
 
-app = typer.Typer()
 
-# Initialize API
-api = ModrinthAPIConfig(MODRINTH_API)
+@cache
+def _get_api() -> ModrinthAPIConfig:
+    """Fetch missing config files on first use and build the API config once"""
+    ensure_config_files(DEFAULT_CONFIGS, console)
+    return ModrinthAPIConfig(MODRINTH_API)
 
 
-@app.command()
-def add(name: str, project_type: str = "mod", pack_name: str | None = None) -> None:
+def add(name: str, project_type: str, pack_name: str | None) -> None:
     """Add a project to the manifest"""
 
     if project_type not in ["mod", "resourcepack", "shaderpack"]:
@@ -36,7 +46,7 @@ def add(name: str, project_type: str = "mod", pack_name: str | None = None) -> N
 
     # Auto-detect pack if not specified
     if not pack_name:
-        manifest = get_manifest(console, Path.cwd())
+        manifest = get_manifest(console, get_cwd())
         if manifest:
             pack_name = manifest.name
         else:
@@ -47,9 +57,9 @@ def add(name: str, project_type: str = "mod", pack_name: str | None = None) -> N
     registry = load_registry(REGISTRY_PATH)
     if pack_name not in registry:
         console.print(f"[red]Pack '{pack_name}' not found in registry[/red]")
-        console.print("[yellow]Available packs:[/yellow]")
-        for p in registry:
-            console.print(f"  - {p}")
+        console.print(
+            "[yellow]Available packs:[/yellow]\n" + "\n".join(f"  - {p}" for p in registry)
+        )
         raise typer.Exit(1)
 
     pack_path = Path(registry[pack_name])
@@ -60,16 +70,20 @@ def add(name: str, project_type: str = "mod", pack_name: str | None = None) -> N
         console.print(f"[red]Could not load manifest at {manifest_file}[/red]")
         raise typer.Exit(1)
 
-    asyncio.run(perform_add(api, name, manifest, project_type, console, manifest_file))
+    api = _get_api()
+    run_with_session(
+        lambda session: perform_add(
+            api, name, manifest, project_type, console, manifest_file, session
+        )
+    )
 
 
-@app.command()
-def resolve(pack_name: str | None = None) -> None:
+def resolve(pack_name: str | None) -> None:
     """Resolve all mod dependencies"""
 
     # Auto-detect pack
     if not pack_name:
-        manifest = get_manifest(console, Path.cwd())
+        manifest = get_manifest(console, get_cwd())
         if manifest:
             pack_name = manifest.name
         else:
@@ -91,33 +105,29 @@ def resolve(pack_name: str | None = None) -> None:
 
     console.print(f"[cyan]Resolving dependencies for {pack_name}...[/cyan]")
 
+    api = _get_api()
     policy = ModPolicy(POLICY_PATH)
     resolver = ModResolver(
         policy=policy, api=api, mc_version=manifest.minecraft, loader=manifest.loader
     )
 
-    async def do_resolve():
-        async with await get_api_session() as session:
-            return await resolver.resolve(manifest.mods, session)
-
     try:
-        resolved_mods = asyncio.run(do_resolve())
+        resolved_mods = run_with_session(lambda session: resolver.resolve(manifest.mods, session))
     except Exception as e:
         console.print(f"[red]Resolution failed:[/red] {e}")
         raise typer.Exit(1) from e
 
-    manifest.mods = sorted(list(resolved_mods))
-    manifest_file.write_text(manifest.model_dump_json(indent=4))
+    manifest.mods = sorted(resolved_mods)
+    write_manifest(manifest_file, manifest)
 
     console.print(f"[green]✓ Resolved {len(manifest.mods)} mods[/green]")
 
 
-@app.command()
-def build(pack_name: str | None = None) -> None:
+def build(pack_name: str | None) -> None:
     """Download all mods and dependencies"""
 
     if not pack_name:
-        manifest = get_manifest(console, Path.cwd())
+        manifest = get_manifest(console, get_cwd())
         if manifest:
             pack_name = manifest.name
         else:
@@ -143,7 +153,8 @@ def build(pack_name: str | None = None) -> None:
     console.print(f"[cyan]Building {manifest.name}...[/cyan]")
 
     try:
-        asyncio.run(run(api, manifest, mods_dir, index_file))
+        api = _get_api()
+        run_with_session(lambda session: run(api, manifest, mods_dir, index_file, session))
         console.print("[green]✓ Build complete[/green]")
     except Exception as e:
         console.print(f"[red]Build failed:[/red] {e}")
@@ -5,18 +5,12 @@ Project management commands - List and remove projects
 from pathlib import Path
 import shutil
 
-from rich.panel import Panel
-from rich.prompt import Confirm
-from rich.table import Table
 import typer
 
 from modforge_cli.cli.shared import REGISTRY_PATH, console
 from modforge_cli.core import load_registry, save_registry_atomic
 
-app = typer.Typer()
 
-
-@app.command(name="ls")
 def list_projects() -> None:
     """List all registered modpacks"""
     registry = load_registry(REGISTRY_PATH)
@@ -26,6 +20,8 @@ def list_projects() -> None:
         console.print("[dim]Run 'ModForge-CLI setup <name>' to create one[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(title="ModForge-CLI Projects", header_style="bold magenta")
     table.add_column("Name", style="cyan")
     table.add_column("Location", style="dim")
@@ -36,7 +32,6 @@ def list_projects() -> None:
     console.print(table)
 
 
-@app.command()
 def remove(pack_name: str) -> None:
     """Remove a modpack and unregister it"""
     registry = load_registry(REGISTRY_PATH)
@@ -47,6 +42,9 @@ def remove(pack_name: str) -> None:
 
     pack_path = Path(registry[pack_name])
 
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
     console.print(
         Panel.fit(
             f"[bold red]This will permanently delete:[/bold red]\n\n"
@@ -2,26 +2,16 @@
 Setup command - Initialize a new modpack project
 """
 
-import json
-from pathlib import Path
-
 import typer
 
-from modforge_cli.cli.shared import FABRIC_LOADER_VERSION, REGISTRY_PATH, console
-from modforge_cli.core import Manifest, load_registry, save_registry_atomic
-
-app = typer.Typer()
+from modforge_cli import jsonio
+from modforge_cli.cli.shared import REGISTRY_PATH, console, get_cwd
+from modforge_cli.core import Manifest, load_registry, save_registry_atomic, write_manifest
 
 
-@app.command()
-def setup(
-    name: str,
-    mc: str = "1.21.1",
-    loader: str = "fabric",
-    loader_version: str = FABRIC_LOADER_VERSION,
-) -> None:
+def setup(name: str, mc: str, loader: str, loader_version: str) -> None:
     """Initialize a new modpack project"""
-    pack_dir = Path.cwd() / name
+    pack_dir = get_cwd() / name
 
     if pack_dir.exists():
         console.print(f"[red]Error:[/red] Directory '{name}' already exists")
@@ -42,7 +32,7 @@ def setup(
 
     # Create manifest
     manifest = Manifest(name=name, minecraft=mc, loader=loader, loader_version=loader_version)
-    (pack_dir / "ModForge-CLI.json").write_text(manifest.model_dump_json(indent=4))
+    write_manifest(pack_dir / "ModForge-CLI.json", manifest)
 
     # Create Modrinth index
     loader_key_map = {
@@ -61,7 +51,7 @@ def setup(
         "files": [],
         "dependencies": {loader_key: loader_version, "minecraft": mc},
     }
-    (pack_dir / "modrinth.index.json").write_text(json.dumps(index_data, indent=2))
+    (pack_dir / "modrinth.index.json").write_bytes(jsonio.dumps(index_data, indent=True))
 
     # Register project
     registry = load_registry(REGISTRY_PATH)
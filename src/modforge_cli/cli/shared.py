@@ -2,18 +2,25 @@
 Shared utilities and constants for CLI commands.
 """
 
+from functools import cache
+import os
 from pathlib import Path
 
 from rich.console import Console
 
-# Shared console instance
-console = Console()
+# Shared console instance; output is styled with explicit markup, so skip the
+# auto-highlighter regex pass on every print
+console = Console(highlight=False)
+
+# Home directory, resolved once
+HOME = Path.home()
 
 # Configuration paths
-CONFIG_PATH = Path.home() / ".config" / "ModForge-CLI"
+CONFIG_PATH = HOME / ".config" / "ModForge-CLI"
 REGISTRY_PATH = CONFIG_PATH / "registry.json"
 MODRINTH_API = CONFIG_PATH / "modrinth_api.json"
 POLICY_PATH = CONFIG_PATH / "policy.json"
+CACHE_PATH = HOME / ".cache" / "ModForge-CLI"
 
 # Constants
 FABRIC_LOADER_VERSION = "0.16.9"
@@ -30,6 +37,12 @@ FABRIC_INSTALLER_SHA256 = "8fa465768bd7fc452e08c3a1e5c8a6b4b5f6a4e64bc7def47f89d
 DEFAULT_MODRINTH_API_URL = f"{GITHUB_RAW}/{VERSION_TAG}/configs/modrinth_api.json"
 DEFAULT_POLICY_URL = f"{GITHUB_RAW}/{VERSION_TAG}/configs/policy.json"
 
+# (path, default download URL, label) of every config fetched on first use
+DEFAULT_CONFIGS = [
+    (MODRINTH_API, DEFAULT_MODRINTH_API_URL, "Modrinth API"),
+    (POLICY_PATH, DEFAULT_POLICY_URL, "Policy"),
+]
+
 
 def get_version_info() -> tuple[str, str]:
     """Get version and author info"""
@@ -39,3 +52,18 @@ def get_version_info() -> tuple[str, str]:
         return __version__, __author__
     except ImportError:
         return "unknown", "Frank1o3"
+
+
+@cache
+def get_cwd() -> Path:
+    """Working directory, looked up once (the CLI never chdirs)"""
+    return Path.cwd()
+
+
+def dir_nonempty(path: Path) -> bool:
+    """True if path is a directory with at least one entry; stops at the first one"""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
@@ -2,26 +2,57 @@
 SKLauncher integration command
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import json
+import os
 from pathlib import Path
 import platform
 import shutil
 
 import typer
 
-from modforge_cli.cli.shared import FABRIC_LOADER_VERSION, REGISTRY_PATH, console
+from modforge_cli import jsonio
+from modforge_cli.cli.shared import (
+    FABRIC_LOADER_VERSION,
+    HOME,
+    REGISTRY_PATH,
+    console,
+    dir_nonempty,
+    get_cwd,
+)
 from modforge_cli.core import get_manifest, load_registry
 
-app = typer.Typer()
+OVERRIDE_COPY_WORKERS = 8
 
 
-@app.command()
-def sklauncher(pack_name: str | None = None, profile_name: str | None = None) -> None:
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a file, falling back to a real copy across devices or on unsupported filesystems"""
+    if os.path.lexists(dst):
+        # Already linked by a previous run: nothing to do
+        if os.path.samefile(src, dst):
+            return
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _copy_override(entry: os.DirEntry[str], dst: Path) -> None:
+    """Copy one top-level overrides entry (directory tree or file), replacing an existing tree"""
+    if entry.is_dir():
+        if dst.exists():
+            shutil.rmtree(dst)
+        shutil.copytree(entry.path, dst)
+    else:
+        shutil.copy2(entry.path, dst)
+
+
+def sklauncher(pack_name: str | None, profile_name: str | None) -> None:
     """Create SKLauncher-compatible profile (alternative to export)"""
 
     if not pack_name:
-        manifest = get_manifest(console, Path.cwd())
+        manifest = get_manifest(console, get_cwd())
         if manifest:
             pack_name = manifest.name
         else:
@@ -40,17 +71,17 @@ def sklauncher(pack_name: str | None = None, profile_name: str | None = None) ->
 
     # Check if mods are built
     mods_dir = pack_path / "mods"
-    if not mods_dir.exists() or not any(mods_dir.iterdir()):
+    if not dir_nonempty(mods_dir):
         console.print("[red]No mods found. Run 'ModForge-CLI build' first[/red]")
         raise typer.Exit(1)
 
     # Get Minecraft directory
     if platform.system() == "Windows":
-        minecraft_dir = Path.home() / "AppData" / "Roaming" / ".minecraft"
+        minecraft_dir = HOME / "AppData" / "Roaming" / ".minecraft"
     elif platform.system() == "Darwin":
-        minecraft_dir = Path.home() / "Library" / "Application Support" / "minecraft"
+        minecraft_dir = HOME / "Library" / "Application Support" / "minecraft"
     else:
-        minecraft_dir = Path.home() / ".minecraft"
+        minecraft_dir = HOME / ".minecraft"
 
     if not minecraft_dir.exists():
         console.print(f"[red]Minecraft directory not found: {minecraft_dir}[/red]")
@@ -68,30 +99,42 @@ def sklauncher(pack_name: str | None = None, profile_name: str | None = None) ->
 
     # Copy mods
     dst_mods = instance_dir / "mods"
-    if dst_mods.exists():
-        shutil.rmtree(dst_mods)
-    shutil.copytree(mods_dir, dst_mods)
-    mod_count = len(list(dst_mods.glob("*.jar")))
+    if dst_mods.is_dir():
+        # Update in place: drop only what the pack no longer has
+        with os.scandir(mods_dir) as it:
+            wanted = {e.name for e in it}
+        with os.scandir(dst_mods) as it:
+            for entry in it:
+                if entry.name in wanted:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+    # ModDownloader writes each jar to a .part file and os.replace()s it into mods/, so a
+    # rebuild gives the pack a new inode and never touches the instance's hardlinked copy.
+    # Linking avoids copying the whole mods dir.
+    shutil.copytree(mods_dir, dst_mods, copy_function=_link_or_copy, dirs_exist_ok=True)
+    # scandir entries carry the dirent type, so these checks need no extra stat
+    with os.scandir(dst_mods) as it:
+        mod_count = sum(1 for e in it if e.name.endswith(".jar") and e.is_file())
     console.print(f"[green]✓ Copied {mod_count} mods[/green]")
 
     # Copy overrides
     overrides_src = pack_path / "overrides"
-    if overrides_src.exists():
-        for item in overrides_src.iterdir():
-            dst = instance_dir / item.name
-            if item.is_dir():
-                if dst.exists():
-                    shutil.rmtree(dst)
-                shutil.copytree(item, dst)
-            else:
-                shutil.copy2(item, dst)
+    if overrides_src.is_dir():
+        # Top-level overrides share nothing, so copy them concurrently (I/O bound)
+        with os.scandir(overrides_src) as it, ThreadPoolExecutor(OVERRIDE_COPY_WORKERS) as pool:
+            futures = [pool.submit(_copy_override, e, instance_dir / e.name) for e in it]
+            for future in futures:
+                future.result()
         console.print("[green]✓ Copied overrides[/green]")
 
     # Update launcher_profiles.json
     profiles_file = minecraft_dir / "launcher_profiles.json"
 
     if profiles_file.exists():
-        profiles_data = json.loads(profiles_file.read_text())
+        profiles_data = jsonio.loads(profiles_file.read_bytes())
     else:
         profiles_data = {"profiles": {}, "settings": {}, "version": 3}
 
@@ -110,7 +153,7 @@ def sklauncher(pack_name: str | None = None, profile_name: str | None = None) ->
     }
 
     # Save profiles
-    profiles_file.write_text(json.dumps(profiles_data, indent=2))
+    jsonio.write_atomic(profiles_file, profiles_data, indent=True)
 
     console.print("\n[green bold]✓ SKLauncher profile created![/green bold]")
     console.print(f"\n[cyan]Profile:[/cyan] {profile_name}")
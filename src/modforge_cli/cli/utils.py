@@ -7,13 +7,10 @@ import sys
 
 import typer
 
-from modforge_cli.cli.shared import MODRINTH_API, POLICY_PATH, REGISTRY_PATH, console
+from modforge_cli.cli.shared import DEFAULT_CONFIGS, REGISTRY_PATH, console
 from modforge_cli.core import load_registry, self_update as core_self_update
 
-app = typer.Typer()
 
-
-@app.command()
 def doctor() -> None:
     """Validate ModForge-CLI installation"""
     console.print("[bold cyan]Running diagnostics...[/bold cyan]\n")
@@ -24,13 +21,15 @@ def doctor() -> None:
     py_version = f"{sys.version_info.major}.{sys.version_info.minor}"
     console.print(f"[green]✓[/green] Python {py_version}")
 
-    # Check config files
-    for name, path in [("API Config", MODRINTH_API), ("Policy", POLICY_PATH)]:
+    # Check config files (report only; add/resolve/build download missing ones)
+    for path, _, name in DEFAULT_CONFIGS:
         if path.exists():
-            console.print(f"[green]✓[/green] {name}: {path}")
+            console.print(f"[green]✓[/green] {name} config: {path}")
         else:
-            console.print(f"[red]✗[/red] {name} missing")
-            issues.append(f"Reinstall {name}")
+            console.print(f"[red]✗[/red] {name} config missing")
+            issues.append(
+                f"Missing {name} config: 'ModForge-CLI add', 'resolve' or 'build' downloads it"
+            )
 
     # Check registry
     registry = load_registry(REGISTRY_PATH)
@@ -54,7 +53,6 @@ def doctor() -> None:
         console.print("[green bold]✓ All checks passed![/green bold]")
 
 
-@app.command(name="self-update")
 def self_update_cmd() -> None:
     """Update ModForge-CLI to latest version"""
     try:
@@ -1,19 +1,34 @@
+from .cache import cached_get, load_version_cache, save_version_cache
 from .downloader import ModDownloader
-from .models import Hit, Manifest, ProjectVersion, ProjectVersionList, SearchResult
+from .models import (
+    Hit,
+    IndexFile,
+    IndexFileList,
+    Manifest,
+    ProjectVersion,
+    ProjectVersionList,
+    SearchResult,
+    VersionSummary,
+    VersionSummaryList,
+)
 from .policy import ModPolicy
 from .resolver import ModResolver
 from .utils import (
     detect_install_method,
     ensure_config_file,
+    ensure_config_files,
+    fetch_file,
     get_api_session,
     get_manifest,
     install_fabric,
     load_registry,
     perform_add,
     run,
+    run_with_session,
     save_registry_atomic,
     self_update,
     setup_crash_logging,
+    write_manifest,
 )
 
 __all__ = [
@@ -24,10 +39,20 @@ __all__ = [
     "SearchResult",
     "ProjectVersion",
     "ProjectVersionList",
+    "VersionSummary",
+    "VersionSummaryList",
+    "IndexFile",
+    "IndexFileList",
     "ModDownloader",
+    "cached_get",
+    "load_version_cache",
+    "save_version_cache",
     "ensure_config_file",
+    "ensure_config_files",
     "install_fabric",
     "run",
+    "run_with_session",
+    "fetch_file",
     "get_api_session",
     "get_manifest",
     "self_update",
@@ -36,4 +61,5 @@ __all__ = [
     "load_registry",
     "save_registry_atomic",
     "setup_crash_logging",
+    "write_manifest",
 ]
@@ -0,0 +1,103 @@
+import asyncio
+import contextlib
+import hashlib
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import aiohttp
+
+from modforge_cli import jsonio
+
+# Root of every on-disk cache kept by core
+CACHE_DIR = Path.home() / ".cache" / "ModForge-CLI"
+
+# (project_id, mc_version, loader) -> {"etag": ..., "version": ...}, revalidated via If-None-Match
+VERSION_CACHE_PATH = CACHE_DIR / "versions.json"
+
+
+def version_cache_key(project_id: str, mc_version: str, loader: str) -> str:
+    return f"{project_id}|{mc_version}|{loader.lower()}"
+
+
+def load_version_cache(path: Path = VERSION_CACHE_PATH) -> dict[str, dict[str, Any]]:
+    """Load the version cache; a missing or unreadable file is an empty cache"""
+    try:
+        cache = jsonio.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_version_cache(cache: dict[str, dict[str, Any]], path: Path = VERSION_CACHE_PATH) -> None:
+    """Persist the version cache atomically; failures are ignored (it is only a cache)"""
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        jsonio.write_atomic(path, cache)
+
+
+# One file per URL: {"etag": ..., "body": ...}, revalidated via If-None-Match
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+# Entries not rewritten for this long are deleted, so the directory cannot grow without bound
+HTTP_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # seconds
+
+# Cache dirs already pruned by this process
+_PRUNED_DIRS: set[Path] = set()
+
+
+def _read_http_entry(path: Path) -> dict[str, str] | None:
+    try:
+        entry = jsonio.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if isinstance(entry, dict) and "etag" in entry and "body" in entry:
+        return entry
+    return None
+
+
+def _prune_http_cache(cache_dir: Path, max_age: float = HTTP_CACHE_MAX_AGE) -> None:
+    """Delete entries older than max_age; scans each cache dir once per process"""
+    if cache_dir in _PRUNED_DIRS:
+        return
+    _PRUNED_DIRS.add(cache_dir)
+
+    cutoff = time.time() - max_age
+    with contextlib.suppress(OSError), os.scandir(cache_dir) as it:
+        for entry in it:
+            with contextlib.suppress(OSError):
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+
+
+def _write_http_entry(path: Path, entry: dict[str, str]) -> None:
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        jsonio.write_atomic(path, entry)
+    _prune_http_cache(path.parent)
+
+
+async def cached_get(
+    session: aiohttp.ClientSession, url: str, cache_dir: Path = HTTP_CACHE_DIR
+) -> bytes:
+    """
+    GET url and return the response body, revalidating a cached copy with its ETag.
+
+    A 304 answer reuses the stored body; any other non-200 status raises
+    aiohttp.ClientResponseError.
+    """
+    path = cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+    cached = await asyncio.to_thread(_read_http_entry, path)
+    headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304 and cached:
+            return cached["body"].encode()
+        response.raise_for_status()
+        body = await response.read()
+        etag = response.headers.get("ETag")
+
+    if etag:
+        entry = {"etag": etag, "body": body.decode()}
+        await asyncio.to_thread(_write_http_entry, path, entry)
+    return body
@@ -1,18 +1,58 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
-import json
+import os
 from pathlib import Path
+import sys
+from typing import Any, BinaryIO, Protocol, TypeVar
 
 import aiohttp
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
+from modforge_cli import jsonio
 from modforge_cli.api import ModrinthAPIConfig
+from modforge_cli.core.cache import load_version_cache, save_version_cache, version_cache_key
 
-console = Console()
+console = Console(highlight=False)
+
+T = TypeVar("T")
+
+HASH_CHUNK_SIZE = 1 << 20
+DOWNLOAD_CHUNK_SIZE = 1 << 18
+DEFAULT_CONCURRENCY = 16
+
+# Prefer release > beta > alpha when picking a version
+VERSION_PRIORITY = {"release": 3, "beta": 2, "alpha": 1}
+
+
+class _Hasher(Protocol):
+    """The part of a hashlib hash object the downloader uses"""
+
+    def update(self, data: bytes, /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+def _file_sha1(path: Path) -> str:
+    """SHA-1 of a file, streamed; hashlib drops the GIL while digesting"""
+    # Unbuffered: file_digest readinto()s straight into its own buffer, no BufferedReader copy
+    with path.open("rb", buffering=0) as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha1").hexdigest()
+        digest = hashlib.sha1()
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _hash_and_write(f: BinaryIO, chunk: bytes, hashers: list[_Hasher]) -> None:
+    """Feed one downloaded chunk to every hasher and append it to f"""
+    for h in hashers:
+        h.update(chunk)
+    f.write(chunk)
 
 
 class ModDownloader:
@@ -24,58 +64,61 @@ class ModDownloader:
         output_dir: Path,
         index_file: Path,
         session: aiohttp.ClientSession,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        compute_sha512: bool = True,
     ):
         self.api = api
         self.mc_version = mc_version
         self.loader = loader
+        # Compared case-insensitively against every candidate version; lowercase once
+        self._loader_lower = loader.lower()
         self.output_dir = output_dir
         self.index_file = index_file
         self.session = session
+        # Modrinth packs conventionally carry sha512; skipping it roughly halves hashing cost
+        self.compute_sha512 = compute_sha512
+        self._hash_pool: ThreadPoolExecutor | None = None
+        # Caps in-flight requests so large packs don't open one connection per mod
+        self._sem = asyncio.Semaphore(concurrency)
 
-        self.index = json.loads(index_file.read_text())
+        self.index = jsonio.loads(index_file.read_bytes())
 
         # Ensure files array exists
         if "files" not in self.index:
             self.index["files"] = []
 
-    def _select_compatible_version(self, versions: list[dict]) -> dict | None:
+        # Files keyed by path for O(1) lookup/replace; written back as the list on save
+        self._files_by_path: dict[str, dict[str, Any]] = {f["path"]: f for f in self.index["files"]}
+
+        # Version picked per project on earlier builds, revalidated by ETag
+        self._version_cache = load_version_cache()
+
+    def _select_compatible_version(self, versions: list[dict[str, Any]]) -> dict[str, Any] | None:
         """
         Select the most appropriate version based on:
         1. Loader compatibility (fabric/forge/quilt/neoforge)
         2. Minecraft version
         3. Version type (prefer release > beta > alpha)
         """
-        # Normalize loader name for comparison
-        loader_lower = self.loader.lower()
-
-        # Filter versions that match both MC version and loader
-        compatible = []
+        mc_version = self.mc_version
+        loader_lower = self._loader_lower
+        priority = VERSION_PRIORITY.get
+
+        # Single pass: keep the best (version type, publish date) among compatible versions;
+        # strict > keeps the first of equal keys, as the previous stable sort did
+        best = None
+        best_key: tuple[int, str] | None = None
         for v in versions:
-            # Check if MC version matches
-            if self.mc_version not in v.get("game_versions", []):
+            if mc_version not in v.get("game_versions", ()):
                 continue
-
-            # Check if loader matches (case-insensitive)
-            loaders = [l.lower() for l in v.get("loaders", [])]
-            if loader_lower not in loaders:
+            if not any(l.lower() == loader_lower for l in v.get("loaders", ())):
                 continue
 
-            compatible.append(v)
+            key = (priority(v.get("version_type", "alpha"), 0), v.get("date_published", ""))
+            if best_key is None or key > best_key:
+                best, best_key = v, key
 
-        if not compatible:
-            return None
-
-        # Prioritize by version type: release > beta > alpha
-        version_priority = {"release": 3, "beta": 2, "alpha": 1}
-
-        def version_score(v) -> int:
-            vtype = v.get("version_type", "alpha")
-            return version_priority.get(vtype, 0)
-
-        # Sort by version type, then by date (newest first)
-        compatible.sort(key=lambda v: (version_score(v), v.get("date_published", "")), reverse=True)
-
-        return compatible[0]
+        return best
 
     async def download_all(self, project_ids: Iterable[str]) -> None:
         """
@@ -85,52 +128,92 @@ class ModDownloader:
         - files: array of all mods with hashes, URLs, and metadata
         - dependencies: MC version and loader version
         """
-        tasks = [self._download_project(pid) for pid in project_ids]
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold cyan]{task.description}"),
-            BarColumn(),
-            TextColumn("{task.completed}/{task.total}"),
-            console=console,
-        ) as progress:
-            task_id = progress.add_task("Downloading mods", total=len(tasks))
-            for coro in asyncio.as_completed(tasks):
-                await coro
-                progress.advance(task_id)
+        # rich.progress is a sizeable import graph; only commands that download pay for it
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
+        ids = list(project_ids)
+
+        # Per-chunk hashing (and the rare rehash of a cached jar) is CPU bound: one worker
+        # per core, apart from the default I/O executor
+        self._hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[bold cyan]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total}"),
+                console=console,
+                # Redraws are throttled to this rate; advance() never forces a refresh
+                refresh_per_second=8,
+                transient=True,
+            ) as progress:
+                task_id = progress.add_task("Downloading mods", total=len(ids))
+
+                # Each task advances the bar itself; concurrency is capped by self._sem
+                async def download_and_advance(project_id: str) -> None:
+                    await self._download_project(project_id)
+                    progress.advance(task_id)
+
+                await asyncio.gather(*(download_and_advance(pid) for pid in ids))
+        finally:
+            self._hash_pool.shutdown()
+            self._hash_pool = None
 
         # Write updated index
-        self.index_file.write_text(json.dumps(self.index, indent=2))
+        self.index["files"] = list(self._files_by_path.values())
+        jsonio.write_atomic(self.index_file, self.index, indent=True)
+        save_version_cache(self._version_cache)
+
+    async def _hash(self, fn: Callable[..., T], *args: object) -> T:
+        """Run a hashing function on the hash pool (default executor outside download_all)"""
+        return await asyncio.get_running_loop().run_in_executor(self._hash_pool, fn, *args)
 
     async def _download_project(self, project_id: str) -> None:
         # 1. Fetch all versions for this project
-        url = self.api.project_versions(project_id)
+        # Let Modrinth drop incompatible versions; the payload shrinks to a handful of entries
+        url = self.api.project_versions(
+            project_id, loaders=[self._loader_lower], game_versions=[self.mc_version]
+        )
+
+        cache_key = version_cache_key(project_id, self.mc_version, self.loader)
+        cached = self._version_cache.get(cache_key)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
 
         try:
-            async with self.session.get(url) as r:
-                if r.status != 200:
+            async with self._sem, self.session.get(url, headers=headers) as r:
+                if r.status == 304 and cached:
+                    # Nothing changed upstream, reuse the previous pick
+                    version = cached["version"]
+                    versions = None
+                elif r.status != 200:
                     console.print(
                         f"[red]Failed to fetch versions for {project_id}: HTTP {r.status}[/red]"
                     )
                     return
-                versions = await r.json()
+                else:
+                    versions = jsonio.loads(await r.read())
+                    etag = r.headers.get("ETag")
         except Exception as e:
             console.print(f"[red]Error fetching {project_id}: {e}[/red]")
             return
 
-        if not versions:
-            console.print(f"[yellow]No versions found for {project_id}[/yellow]")
-            return
+        if versions is not None:
+            if not versions:
+                console.print(f"[yellow]No versions found for {project_id}[/yellow]")
+                return
 
-        # 2. Select compatible version
-        version = self._select_compatible_version(versions)
+            # 2. Select compatible version
+            version = self._select_compatible_version(versions)
 
-        if not version:
-            console.print(
-                f"[yellow]No compatible version for {project_id}[/yellow]\n"
-                f"[dim]  Required: MC {self.mc_version}, Loader: {self.loader}[/dim]"
-            )
-            return
+            if not version:
+                console.print(
+                    f"[yellow]No compatible version for {project_id}[/yellow]\n"
+                    f"[dim]  Required: MC {self.mc_version}, Loader: {self.loader}[/dim]"
+                )
+                return
+
+            if etag:
+                self._version_cache[cache_key] = {"etag": etag, "version": version}
 
         # 3. Find primary file
         files = version.get("files", [])
@@ -150,59 +233,112 @@ class ModDownloader:
         dest = self.output_dir / primary_file["filename"]
 
         # Check if already registered in index
-        existing_entry = next(
-            (f for f in self.index["files"] if f["path"] == f"mods/{primary_file['filename']}"),
-            None,
-        )
+        existing_entry = self._files_by_path.get(f"mods/{primary_file['filename']}")
 
         if existing_entry and dest.exists():
-            # Verify hash matches
-            existing_hash = hashlib.sha1(dest.read_bytes()).hexdigest()
-            if existing_hash == primary_file["hashes"]["sha1"]:
+            expected_sha1 = primary_file["hashes"]["sha1"]
+            # Index already records this exact file and the size matches: skip hashing
+            if (
+                existing_entry["hashes"].get("sha1") == expected_sha1
+                and dest.stat().st_size == primary_file.get("size")
+            ) or await self._hash(_file_sha1, dest) == expected_sha1:
                 console.print(f"[dim]✓ {primary_file['filename']} (cached)[/dim]")
                 return
 
-        # Download the file
+        # Download beside the target and swap it in only once verified, so a failed or
+        # bad download never truncates the file already at dest (or its hardlinks)
+        part = dest.with_name(f"{dest.name}.part")
+        sha1_h = hashlib.sha1()
+        sha512_h = hashlib.sha512() if self.compute_sha512 else None
         try:
-            async with self.session.get(primary_file["url"]) as r:
-                if r.status != 200:
-                    console.print(
-                        f"[red]Failed to download {primary_file['filename']}: HTTP {r.status}[/red]"
-                    )
-                    return
-                data = await r.read()
-                dest.write_bytes(data)
-        except Exception as e:
-            console.print(f"[red]Download error for {primary_file['filename']}: {e}[/red]")
-            return
+            if not await self._fetch_file(primary_file, part, sha1_h, sha512_h):
+                return
 
-        # 5. Verify hash
-        sha1 = hashlib.sha1(data).hexdigest()
-        sha512 = hashlib.sha512(data).hexdigest()
+            # 5. Verify hash
+            sha1 = sha1_h.hexdigest()
 
-        if sha1 != primary_file["hashes"]["sha1"]:
-            dest.unlink(missing_ok=True)
-            raise RuntimeError(
-                f"Hash mismatch for {primary_file['filename']}\n"
-                f"  Expected: {primary_file['hashes']['sha1']}\n"
-                f"  Got:      {sha1}"
-            )
+            if sha1 != primary_file["hashes"]["sha1"]:
+                raise RuntimeError(
+                    f"Hash mismatch for {primary_file['filename']}\n"
+                    f"  Expected: {primary_file['hashes']['sha1']}\n"
+                    f"  Got:      {sha1}"
+                )
+
+            # A new inode takes over the name atomically; hardlinked copies keep their contents
+            os.replace(part, dest)
+        finally:
+            # Left behind by any failure or cancellation; already gone after os.replace
+            part.unlink(missing_ok=True)
 
         # 6. Register in index (Modrinth format)
+        hashes = {"sha1": sha1}
+        if sha512_h is not None:
+            hashes["sha512"] = sha512_h.hexdigest()
         file_entry = {
             "path": f"mods/{primary_file['filename']}",
-            "hashes": {"sha1": sha1, "sha512": sha512},
+            "hashes": hashes,
             "downloads": [primary_file["url"]],
             "fileSize": primary_file["size"],
         }
 
-        # Remove existing entry if present (update scenario)
-        self.index["files"] = [f for f in self.index["files"] if f["path"] != file_entry["path"]]
-
-        # Add new entry
-        self.index["files"].append(file_entry)
+        # Add new entry, replacing any existing one (update scenario)
+        self._files_by_path[file_entry["path"]] = file_entry
 
         console.print(
             f"[green]✓[/green] {primary_file['filename']} "
             f"[dim](v{version.get('version_number')}, {self.loader})[/dim]"
         )
+
+    async def _fetch_file(
+        self,
+        primary_file: dict[str, Any],
+        part: Path,
+        sha1_h: _Hasher,
+        sha512_h: _Hasher | None,
+    ) -> bool:
+        """
+        Stream primary_file into part, hashing and writing each chunk in a single pass.
+
+        Returns False (after reporting why) when the download failed or is incomplete.
+        """
+        filename = primary_file["filename"]
+        expected_size = primary_file.get("size")
+        try:
+            async with self._sem, self.session.get(primary_file["url"]) as r:
+                if r.status != 200:
+                    console.print(f"[red]Failed to download {filename}: HTTP {r.status}[/red]")
+                    return False
+
+                # A wrong Content-Length means a truncated/bad response; skip hashing and writing
+                content_length = r.headers.get("Content-Length")
+                if (
+                    expected_size is not None
+                    and content_length is not None
+                    and "Content-Encoding" not in r.headers
+                    and int(content_length) != expected_size
+                ):
+                    console.print(
+                        f"[red]Size mismatch for {filename}: "
+                        f"expected {expected_size} bytes, server sent {content_length}[/red]"
+                    )
+                    return False
+
+                hashers = [sha1_h] if sha512_h is None else [sha1_h, sha512_h]
+                written = 0
+                with part.open("wb") as f:
+                    async for chunk in r.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        # Hashing and the disk write run on the hash pool, off the event loop
+                        await self._hash(_hash_and_write, f, chunk, hashers)
+                        written += len(chunk)
+        except Exception as e:
+            console.print(f"[red]Download error for {filename}: {e}[/red]")
+            return False
+
+        if expected_size is not None and written != expected_size:
+            console.print(
+                f"[red]Incomplete download for {filename}: "
+                f"got {written} of {expected_size} bytes[/red]"
+            )
+            return False
+
+        return True
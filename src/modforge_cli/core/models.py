@@ -29,6 +29,15 @@ class SearchResult(BaseAPIModel):
     hits: list[Hit] = Field(default_factory=list)
 
 
+class ProjectSummary(BaseAPIModel):
+    """The slice of a project the resolver reads from the bulk /projects endpoint"""
+
+    id: str
+    slug: str
+    project_type: str
+    game_versions: list[str] = Field(default_factory=list)
+
+
 class Dependency(BaseAPIModel):
     dependency_type: Literal["required", "optional", "incompatible", "embedded"] | None = None
     file_name: str | None = None
@@ -61,6 +70,41 @@ class ProjectVersion(BaseAPIModel):
         return self.version_type == "release"
 
 
-ProjectVersionList = TypeAdapter(list[ProjectVersion])
+class VersionSummary(BaseAPIModel):
+    """The slice of a version the resolver reads; files and hashes are not parsed"""
 
-__all__ = ["Manifest", "SearchResult", "ProjectVersion", "ProjectVersionList"]
+    version_type: str
+    dependencies: list[Dependency] = Field(default_factory=list)
+    game_versions: list[str] = Field(default_factory=list)
+    loaders: list[str] = Field(default_factory=list)
+
+    @property
+    def is_release(self) -> bool:
+        return self.version_type == "release"
+
+
+class IndexFile(BaseModel):
+    path: str
+    hashes: dict[str, str]
+    downloads: list[str]
+    file_size: int = Field(alias="fileSize")
+    env: dict[str, str] | None = None
+
+
+ProjectSummaryList = TypeAdapter(list[ProjectSummary])
+ProjectVersionList = TypeAdapter(list[ProjectVersion])
+VersionSummaryList = TypeAdapter(list[VersionSummary])
+IndexFileList = TypeAdapter(list[IndexFile])
+
+__all__ = [
+    "Manifest",
+    "SearchResult",
+    "ProjectSummary",
+    "ProjectSummaryList",
+    "ProjectVersion",
+    "ProjectVersionList",
+    "VersionSummary",
+    "VersionSummaryList",
+    "IndexFile",
+    "IndexFileList",
+]
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 from collections import deque
-from collections.abc import Iterable
-import json
+from collections.abc import Callable, Iterable
+import contextlib
+from functools import cached_property, lru_cache
+import hashlib
+import os
 from pathlib import Path
-from typing import TypedDict
+import threading
+import time
+from typing import Any, NamedTuple, cast
 from urllib.parse import urlparse
 from urllib.request import urlopen
 
-from jsonschema import ValidationError, validate
+from modforge_cli import jsonio
+from modforge_cli.core.cache import CACHE_DIR
 
 
-class NormalizedModRule(TypedDict):
-    conflicts: set[str]
-    sub_mods: set[str]
+class NormalizedModRule(NamedTuple):
+    conflicts: frozenset[str]
+    sub_mods: frozenset[str]
 
 
 NormalizedPolicyRules = dict[str, NormalizedModRule]
@@ -24,24 +30,68 @@ class PolicyError(RuntimeError):
 
 
 # -------- schema cache (performance + offline safety) --------
-_SCHEMA_CACHE: dict[str, dict] = {}
+_SCHEMA_CACHE: dict[str, dict[str, Any]] = {}
 
+# Remote schemas are persisted here and refreshed in the background once stale
+SCHEMA_CACHE_DIR = CACHE_DIR / "schemas"
+SCHEMA_CACHE_TTL = 24 * 60 * 60  # seconds
 
-def _load_schema(schema_ref: str, base_path: Path) -> dict:
+
+def _fetch_schema(schema_ref: str) -> dict[str, Any]:
+    with urlopen(schema_ref) as resp:
+        return cast(dict[str, Any], jsonio.loads(resp.read()))
+
+
+def _write_schema_cache(cache_file: Path, schema: dict[str, Any]) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    jsonio.write_atomic(cache_file, schema)
+
+
+def _refresh_schema(schema_ref: str, cache_file: Path) -> None:
+    """Background refresh; failures keep the stale copy in place"""
+    with contextlib.suppress(Exception):
+        _write_schema_cache(cache_file, _fetch_schema(schema_ref))
+
+
+def _load_remote_schema(schema_ref: str) -> dict[str, Any]:
+    """
+    Stale-while-revalidate: serve the on-disk copy when present, refreshing
+    it on a daemon thread once older than SCHEMA_CACHE_TTL. Only a missing
+    cache blocks on the network.
+    """
+    # Keyed on the full URL: schemas from different hosts may share a file name
+    cache_file = SCHEMA_CACHE_DIR / f"{hashlib.sha256(schema_ref.encode()).hexdigest()}.json"
+
+    try:
+        schema = cast(dict[str, Any], jsonio.loads(cache_file.read_bytes()))
+    except (OSError, ValueError):
+        schema = _fetch_schema(schema_ref)
+        with contextlib.suppress(OSError):
+            _write_schema_cache(cache_file, schema)
+        return schema
+
+    if time.time() - cache_file.stat().st_mtime > SCHEMA_CACHE_TTL:
+        threading.Thread(target=_refresh_schema, args=(schema_ref, cache_file), daemon=True).start()
+
+    return schema
+
+
+def _load_schema(schema_ref: str, base_path: Path) -> dict[str, Any]:
     if schema_ref in _SCHEMA_CACHE:
         return _SCHEMA_CACHE[schema_ref]
 
     parsed = urlparse(schema_ref)
 
     try:
-        if parsed.scheme in ("http", "https", "file"):
-            with urlopen(schema_ref) as resp:
-                schema = json.load(resp)
+        if parsed.scheme in ("http", "https"):
+            schema = _load_remote_schema(schema_ref)
+        elif parsed.scheme == "file":
+            schema = _fetch_schema(schema_ref)
         else:
             schema_path = (base_path.parent / schema_ref).resolve()
             if not schema_path.exists():
                 raise PolicyError(f"Schema not found: {schema_path}")
-            schema = json.loads(schema_path.read_text())
+            schema = cast(dict[str, Any], jsonio.loads(schema_path.read_bytes()))
     except Exception as e:
         raise PolicyError(f"Failed to load schema '{schema_ref}': {e}") from e
 
@@ -49,6 +99,24 @@ def _load_schema(schema_ref: str, base_path: Path) -> dict:
     return schema
 
 
+# schema_ref -> compiled validator; the meta-schema check runs once per schema
+_VALIDATOR_CACHE: dict[str, Any] = {}
+
+
+def _get_validator(schema_ref: str, base_path: Path) -> Any:
+    if schema_ref in _VALIDATOR_CACHE:
+        return _VALIDATOR_CACHE[schema_ref]
+
+    # jsonschema pulls in a large import graph; only pay for it here
+    from jsonschema.validators import validator_for
+
+    schema = _load_schema(schema_ref, base_path)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = _VALIDATOR_CACHE[schema_ref] = cls(schema)
+    return validator
+
+
 class ModPolicy:
     """
     Enforces mod compatibility rules:
@@ -59,6 +127,7 @@ class ModPolicy:
     def __init__(self, policy_path: str | Path = "configs/policy.json"):
         self.policy_path = policy_path if isinstance(policy_path, Path) else Path(policy_path)
         self.rules: NormalizedPolicyRules = {}
+        self._raw_rules: dict[str, dict[str, list[str]]] = {}
         self.schema_ref: str | None = None
 
         self._load()
@@ -69,24 +138,32 @@ class ModPolicy:
 
     def _load(self) -> None:
         try:
-            raw = json.loads(self.policy_path.read_text())
+            raw = jsonio.loads(self.policy_path.read_bytes())
 
             self.schema_ref = raw.get("$schema")
             if not self.schema_ref:
                 raise PolicyError("Policy file missing $schema field")
 
             raw.pop("$schema", None)
-            self.rules = raw
-
-            del raw
+            self._raw_rules = raw
         except Exception as e:
             raise PolicyError(f"Failed to load policy: {e}") from e
 
     def _validate(self) -> None:
+        # Escape hatch for CI/dev runs against a known-good policy
+        if os.environ.get("MODFORGE_SKIP_SCHEMA") == "1":
+            return
+        if self.schema_ref is None:
+            raise PolicyError("Policy file missing $schema field")
+
+        from jsonschema import ValidationError
+        from jsonschema.exceptions import best_match
+
         try:
-            schema = _load_schema(self.schema_ref, self.policy_path)
-            validate(instance=self.rules, schema=schema)
-            del schema
+            validator = _get_validator(self.schema_ref, self.policy_path)
+            error = best_match(validator.iter_errors(self._raw_rules))
+            if error is not None:
+                raise error
         except ValidationError as e:
             raise PolicyError(f"Policy schema violation:\n{e.message}") from e
         except Exception as e:
@@ -94,11 +171,15 @@ class ModPolicy:
 
     def _normalize(self) -> None:
         """
-        Normalize rule values into sets for O(1) lookups
+        Normalize rules into immutable (conflicts, sub_mods) frozenset pairs:
+        one dict lookup per mod on the hot path, O(1) membership tests
         """
-        for rule in self.rules.values():
-            rule["conflicts"] = set(rule.get("conflicts", []))
-            rule["sub_mods"] = set(rule.get("sub_mods", []))
+        self.rules = {
+            name: NormalizedModRule(
+                frozenset(rule.get("conflicts", [])), frozenset(rule.get("sub_mods", []))
+            )
+            for name, rule in self._raw_rules.items()
+        }
 
     # ---------- public API ----------
 
@@ -108,54 +189,63 @@ class ModPolicy:
         Recursively adds sub-mods and removes conflicts.
         Explicit mods always win over implicit ones.
         """
-        explicit: set[str] = set(mods)
-        active: set[str] = set(explicit)
+        return set(self._apply_cached(frozenset(mods)))
+
+    @cached_property
+    def _apply_cached(self) -> Callable[[frozenset[str]], frozenset[str]]:
+        """
+        Per-instance memo of _apply. Rules are fixed after __init__, so the
+        result depends only on the input set; caching per instance avoids a
+        class-level cache holding every policy alive.
+        """
+        return lru_cache(maxsize=128)(self._apply)
+
+    def _apply(self, mods: frozenset[str]) -> frozenset[str]:
+        # Mods without a rule can neither pull in sub-mods nor conflict
+        ruled = mods & self.rules.keys()
+        if not ruled:
+            return mods
+
+        explicit = mods
+        active: set[str] = set(mods)
         implicit: set[str] = set()
 
-        queue = deque(active)
+        queue = deque(ruled)
 
         # 1. Expand sub-mods recursively
         while queue:
             current = queue.popleft()
             rule = self.rules.get(current)
-            if not rule:
+            if rule is None:
                 continue
 
-            for sub in rule["sub_mods"]:
+            for sub in rule.sub_mods:
                 if sub not in active:
                     active.add(sub)
                     implicit.add(sub)
                     queue.append(sub)
 
         # 2. Resolve conflicts (implicit loses first)
-        for mod in sorted(active):
-            rule = self.rules.get(mod)
-            if not rule:
-                continue
+        conflicts = set().union(*(self.rules[m].conflicts for m in active & self.rules.keys()))
+        if not conflicts:
+            return frozenset(active)
 
-            for conflict in rule["conflicts"]:
-                if conflict in active:
-                    if conflict in explicit and mod in explicit:
-                        raise PolicyError(f"Explicit mod conflict: {mod} ↔ {conflict}")
+        for mod in sorted(ruled):
+            clash = self.rules[mod].conflicts & explicit
+            if clash:
+                raise PolicyError(f"Explicit mod conflict: {mod} ↔ {min(clash)}")
 
-                    if conflict in implicit:
-                        active.remove(conflict)
-                        implicit.discard(conflict)
-
-        del queue, explicit, implicit
-        return active
+        active -= implicit & conflicts
+        return frozenset(active)
 
     def diff(self, mods: Iterable[str]) -> dict[str, list[str]]:
         """
         Show what would change without applying.
         """
-        original = set(mods)
-        final = self.apply(mods)
+        original = frozenset(mods)
+        final = self._apply_cached(original)
 
-        diff = {
+        return {
             "added": sorted(final - original),
             "removed": sorted(original - final),
         }
-
-        del original, final
-        return diff
@@ -1,18 +1,24 @@
 import asyncio
-from collections import deque
 from collections.abc import Iterable
+from typing import Any
 
 import aiohttp
 
 from modforge_cli.api import ModrinthAPIConfig
-from modforge_cli.core.models import ProjectVersion, ProjectVersionList, SearchResult
+from modforge_cli.core.cache import cached_get
+from modforge_cli.core.models import (
+    ProjectSummaryList,
+    SearchResult,
+    VersionSummary,
+    VersionSummaryList,
+)
 from modforge_cli.core.policy import ModPolicy
 
-try:
-    from modforge_cli.__version__ import __author__, __version__
-except ImportError:
-    __version__ = "unknown"
-    __author__ = "Frank1o3"
+# Upper bound on concurrent Modrinth API requests issued by the resolver
+MAX_IN_FLIGHT = 16
+
+# Max slugs per bulk /projects request; keeps the query string well under URL length limits
+BULK_CHUNK_SIZE = 100
 
 
 class ModResolver:
@@ -29,23 +35,56 @@ class ModResolver:
         self.mc_version = mc_version
         self.loader = loader
 
-        self._headers = {"User-Agent": f"{__author__}/ModForge-CLI/{__version__}"}
+        self._sem = asyncio.Semaphore(MAX_IN_FLIGHT)
 
-    def _select_version(self, versions: list[ProjectVersion]) -> ProjectVersion | None:
+    def _select_version(self, versions: list[VersionSummary]) -> VersionSummary | None:
         """
         Prefer:
         1. Release versions
         2. Matching MC + loader
         """
-        for v in versions:
-            if v.is_release and self.mc_version in v.game_versions and self.loader in v.loaders:
-                return v
-
+        fallback: VersionSummary | None = None
         for v in versions:
             if self.mc_version in v.game_versions and self.loader in v.loaders:
-                return v
+                if v.is_release:
+                    return v
+                if fallback is None:
+                    fallback = v
 
-        return None
+        return fallback
+
+    async def _lookup_projects(
+        self, slugs: list[str], session: aiohttp.ClientSession
+    ) -> dict[str, str]:
+        """
+        Map slugs to project IDs via the bulk /projects endpoint, one request per
+        BULK_CHUNK_SIZE slugs. Slugs Modrinth does not know, non-mods and projects
+        without the target MC version are left out for _search_project to handle.
+        """
+
+        async def lookup(chunk: list[str]) -> dict[str, str]:
+            try:
+                async with self._sem:
+                    body = await cached_get(session, self.api.projects_bulk(chunk))
+                projects = ProjectSummaryList.validate_json(body)
+            except Exception as e:
+                print(f"Warning: Bulk project lookup failed: {e}")
+                return {}
+
+            wanted = set(chunk)
+            return {
+                key: p.id
+                for p in projects
+                if p.project_type == "mod" and self.mc_version in p.game_versions
+                for key in (p.slug, p.id)
+                if key in wanted
+            }
+
+        chunks = [slugs[i : i + BULK_CHUNK_SIZE] for i in range(0, len(slugs), BULK_CHUNK_SIZE)]
+        found: dict[str, str] = {}
+        for result in await asyncio.gather(*(lookup(c) for c in chunks)):
+            found.update(result)
+        return found
 
     async def _search_project(self, slug: str, session: aiohttp.ClientSession) -> str | None:
         """Search for a project by slug and return its project_id"""
@@ -56,15 +95,17 @@ class ModResolver:
         )
 
         try:
-            async with session.get(url) as response:
-                data = SearchResult.model_validate_json(await response.text())
-
-            for hit in data.hits:
-                if hit.project_type != "mod":
-                    continue
-                if self.mc_version not in hit.versions:
-                    continue
-                return hit.project_id
+            async with self._sem:
+                data = SearchResult.model_validate_json(await cached_get(session, url))
+
+            return next(
+                (
+                    hit.project_id
+                    for hit in data.hits
+                    if hit.project_type == "mod" and self.mc_version in hit.versions
+                ),
+                None,
+            )
         except Exception as e:
             print(f"Warning: Failed to search for '{slug}': {e}")
 
@@ -72,13 +113,15 @@ class ModResolver:
 
     async def _fetch_versions(
         self, project_id: str, session: aiohttp.ClientSession
-    ) -> list[ProjectVersion]:
-        """Fetch all versions for a project"""
-        url = self.api.project_versions(project_id)
+    ) -> list[VersionSummary]:
+        """Fetch the versions of a project compatible with the target MC version and loader"""
+        url = self.api.project_versions(
+            project_id, loaders=[self.loader], game_versions=[self.mc_version]
+        )
 
         try:
-            async with session.get(url) as response:
-                return ProjectVersionList.validate_json(await response.text())
+            async with self._sem:
+                return VersionSummaryList.validate_json(await cached_get(session, url))
         except Exception as e:
             print(f"Warning: Failed to fetch versions for '{project_id}': {e}")
             return []
@@ -97,88 +140,62 @@ class ModResolver:
         expanded = self.policy.apply(mods)
 
         resolved: set[str] = set()
-        queue: deque[str] = deque()
 
-        search_cache: dict[str, str | None] = {}
-        version_cache: dict[str, list[ProjectVersion]] = {}
+        # Searches (slug → project_id) and version fetches share one task set, so
+        # a project's versions are requested as soon as its search returns and its
+        # dependencies as soon as those versions arrive; no phase or level barrier.
+        searching: dict[asyncio.Task[str | None], str] = {}
+        fetching: dict[asyncio.Task[list[VersionSummary]], str] = {}
 
-        # ---- Phase 1: slug → project_id (parallel) ----
-        search_tasks = []
-        slugs_to_search = []
+        def schedule(pid: str) -> None:
+            if pid not in resolved:
+                resolved.add(pid)
+                fetching[asyncio.create_task(self._fetch_versions(pid, session))] = pid
 
+        # Exact slugs resolve in one bulk request; only the rest fall back to a search each
+        found = await self._lookup_projects(sorted(expanded), session)
         for slug in expanded:
-            if slug not in search_cache:
-                slugs_to_search.append(slug)
-                search_tasks.append(self._search_project(slug, session))
+            if slug in found:
+                schedule(found[slug])
+            else:
+                searching[asyncio.create_task(self._search_project(slug, session))] = slug
 
-        if search_tasks:
-            search_results = await asyncio.gather(*search_tasks, return_exceptions=True)
+        try:
+            while searching or fetching:
+                running: list[asyncio.Task[Any]] = [*searching, *fetching]
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task in searching:
+                        searching.pop(task)
+                        project_id = task.result()
+                        if project_id:
+                            schedule(project_id)
+                        continue
 
-            for slug, result in zip(slugs_to_search, search_results):
-                if isinstance(result, Exception):
-                    print(f"Error searching for '{slug}': {result}")
-                    search_cache[slug] = None
-                else:
-                    search_cache[slug] = result
+                    pid = fetching.pop(task)
+                    version = self._select_version(task.result())
 
-        # Add found projects to queue
-        for slug in expanded:
-            project_id = search_cache.get(slug)
-            if project_id and project_id not in resolved:
-                resolved.add(project_id)
-                queue.append(project_id)
-
-        # ---- Phase 2: dependency resolution (batched) ----
-        BATCH_SIZE = 10
-
-        while queue:
-            # Process in batches to avoid overwhelming the API
-            batch = []
-            for _ in range(min(len(queue), BATCH_SIZE)):
-                if queue:
-                    batch.append(queue.popleft())
-
-            # Fetch versions for batch in parallel
-            version_tasks = []
-            projects_to_fetch = []
-
-            for pid in batch:
-                if pid not in version_cache:
-                    projects_to_fetch.append(pid)
-                    version_tasks.append(self._fetch_versions(pid, session))
-
-            if version_tasks:
-                version_results = await asyncio.gather(*version_tasks, return_exceptions=True)
-
-                for pid, result in zip(projects_to_fetch, version_results, strict=False):
-                    if isinstance(result, Exception):
-                        print(f"Error fetching versions for '{pid}': {result}")
-                        version_cache[pid] = []
-                    else:
-                        version_cache[pid] = result
-
-            # Process dependencies
-            for pid in batch:
-                versions = version_cache.get(pid, [])
-                version = self._select_version(versions)
-
-                if not version:
-                    print(f"Warning: No compatible version found for '{pid}'")
-                    continue
-
-                for dep in version.dependencies:
-                    dtype = dep.dependency_type
-                    dep_id = dep.project_id
-
-                    if not dep_id:
+                    if not version:
+                        print(f"Warning: No compatible version found for '{pid}'")
                         continue
 
-                    if dtype == "incompatible":
-                        raise RuntimeError(f"Incompatible dependency detected: {pid} ↔ {dep_id}")
+                    for dep in version.dependencies:
+                        dtype = dep.dependency_type
+                        dep_id = dep.project_id
+
+                        if not dep_id:
+                            continue
+
+                        if dtype == "incompatible":
+                            raise RuntimeError(
+                                f"Incompatible dependency detected: {pid} ↔ {dep_id}"
+                            )
 
-                    if dtype in ("required", "optional") and dep_id not in resolved:
-                        resolved.add(dep_id)
-                        queue.append(dep_id)
+                        if dtype in ("required", "optional"):
+                            schedule(dep_id)
+        finally:
+            for task in [*searching, *fetching]:
+                task.cancel()
 
-        del queue, expanded, search_cache, version_cache
         return resolved
@@ -1,21 +1,21 @@
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-import json
 from pathlib import Path
 import re
 import shutil
 import subprocess
 import sys
-import tempfile
 import traceback
-import urllib.request
+from typing import TypeVar
 
 import aiohttp
 from rich.console import Console
-from rich.table import Table
 import typer
 
+from modforge_cli import jsonio
 from modforge_cli.api import ModrinthAPIConfig
-from modforge_cli.core import ModDownloader
+from modforge_cli.core.downloader import DOWNLOAD_CHUNK_SIZE, ModDownloader
 from modforge_cli.core.models import Manifest, SearchResult
 
 try:
@@ -24,6 +24,14 @@ except ImportError:
     __version__ = "unknown"
     __author__ = "Frank1o3"
 
+# uvloop is optional (POSIX only); the stdlib event loop is used without it
+try:
+    from uvloop import run as _run_loop  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    _run_loop = asyncio.run
+
+T = TypeVar("T")
+
 
 def normalize_search_term(term: str) -> str:
     """
@@ -129,82 +137,174 @@ def find_best_match(search_term: str, hits: list) -> tuple[object, int]:
 
 def ensure_config_file(path: Path, url: str, label: str, console: Console) -> None:
     """Download config file if missing"""
-    if path.exists():
+    ensure_config_files([(path, url, label)], console)
+
+
+def ensure_config_files(configs: list[tuple[Path, str, str]], console: Console) -> None:
+    """Download every missing (path, url, label) config concurrently over one session"""
+    missing = [(path, url, label) for path, url, label in configs if not path.exists()]
+    if not missing:
         return
 
-    path.parent.mkdir(parents=True, exist_ok=True)
+    for path, _, label in missing:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        console.print(f"[yellow]Missing {label} config.[/yellow] Downloading default…")
 
-    console.print(f"[yellow]Missing {label} config.[/yellow] Downloading default…")
+    async def fetch_all(session: aiohttp.ClientSession) -> list[None | BaseException]:
+        return await asyncio.gather(
+            *(fetch_file(url, path, session) for path, url, _ in missing),
+            return_exceptions=True,
+        )
 
-    try:
-        urllib.request.urlretrieve(url, path)
-        console.print(f"[green]✓ {label} config installed at {path}[/green]")
-    except Exception as e:
-        console.print(f"[red]Failed to download {label} config:[/red] {e}")
-        raise typer.Exit(1) from e
+    failed = False
+    for (path, _, label), result in zip(missing, run_with_session(fetch_all), strict=True):
+        if isinstance(result, BaseException):
+            console.print(f"[red]Failed to download {label} config:[/red] {result}")
+            failed = True
+        else:
+            console.print(f"[green]✓ {label} config installed at {path}[/green]")
+
+    if failed:
+        raise typer.Exit(1)
 
 
 # --- Async Helper ---
+# Modrinth rate-limits at 300 req/min; transient statuses are retried with backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
+
+
+async def _retry_middleware(
+    request: aiohttp.ClientRequest, handler: aiohttp.ClientHandlerType
+) -> aiohttp.ClientResponse:
+    """Retry rate-limited/transient failures, honouring Retry-After when sent."""
+    for attempt in range(MAX_RETRIES):
+        response = await handler(request)
+        if response.status not in RETRY_STATUSES:
+            return response
+
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else RETRY_BACKOFF * 2**attempt
+        response.release()
+        await asyncio.sleep(delay)
+
+    return await handler(request)
+
+
 async def get_api_session() -> aiohttp.ClientSession:
     """Returns a session with the correct ModForge-CLI headers."""
     timeout = aiohttp.ClientTimeout(total=60, connect=10)
+    # One pool per command with cached DNS; keep-alive connections are reused across all
+    # requests. The per-host cap matches the downloader's default concurrency.
+    connector = aiohttp.TCPConnector(
+        limit=32, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=60
+    )
     return aiohttp.ClientSession(
         headers={"User-Agent": f"{__author__}/ModForge-CLI/{__version__}"},
         timeout=timeout,
+        connector=connector,
         raise_for_status=False,  # Handle errors manually
+        middlewares=(_retry_middleware,),
+        # Lets body reads hand back up to DOWNLOAD_CHUNK_SIZE at once instead of 64 KiB
+        read_bufsize=DOWNLOAD_CHUNK_SIZE,
     )
 
 
-def get_manifest(console: Console, path: Path = Path.cwd()) -> Manifest | None:
-    """Load and validate manifest file"""
-    p = path / "ModForge-CLI.json"
-    if not p.exists():
-        return None
+async def _with_api_session(fn: Callable[[aiohttp.ClientSession], Awaitable[T]]) -> T:
+    """Await fn with a fresh API session, closed once fn finishes"""
+    async with await get_api_session() as session:
+        return await fn(session)
+
+
+async def fetch_file(url: str, dest: Path, session: aiohttp.ClientSession | None = None) -> None:
+    """Stream a download to dest, reusing an existing session when one is given"""
+    if session is None:
+        return await _with_api_session(lambda s: fetch_file(url, dest, s))
+
+    # Write beside the target and rename, so a failed download never leaves a partial file
+    part = dest.with_name(f"{dest.name}.part")
+    try:
+        async with session.get(url, raise_for_status=True) as response:
+            with part.open("wb") as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        part.replace(dest)
+    finally:
+        part.unlink(missing_ok=True)
+
+
+def run_with_session(fn: Callable[[aiohttp.ClientSession], Awaitable[T]]) -> T:
+    """
+    Run an async command body on a fresh event loop with one shared API session.
+
+    Everything the body awaits (search, resolve, downloads) reuses the same
+    connection pool, DNS cache and TLS sessions.
+    """
+    # Annotated: _run_loop is untyped when uvloop provides it
+    result: T = _run_loop(_with_api_session(fn))
+    return result
+
+
+def get_manifest(console: Console, path: Path | None = None) -> Manifest | None:
+    """Load and validate manifest file (defaults to the current directory)"""
+    p = (path if path is not None else Path.cwd()) / "ModForge-CLI.json"
     try:
-        return Manifest.model_validate_json(p.read_text())
+        return Manifest.model_validate_json(p.read_bytes())
+    except FileNotFoundError:
+        return None
     except Exception as e:
         console.print(f"[red]Error parsing manifest:[/red] {e}")
         return None
 
 
-def save_registry_atomic(registry: dict, path: Path) -> None:
+def write_manifest(path: Path, manifest: Manifest) -> None:
+    """Atomically serialize a manifest to disk via orjson (2-space indent)"""
+    jsonio.write_atomic(path, manifest.model_dump(mode="json"), indent=True)
+
+
+def save_registry_atomic(registry: dict[str, str], path: Path) -> None:
     """
     Atomically save registry to prevent corruption from concurrent access.
 
-    Uses a temp file + atomic rename to ensure the registry is never
-    left in a partially-written state.
+    The registry is never left in a partially-written state (see jsonio.write_atomic).
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to temp file in same directory (required for atomic rename)
-    with tempfile.NamedTemporaryFile(
-        mode="w", delete=False, dir=path.parent, prefix=".registry-", suffix=".tmp"
-    ) as f:
-        json.dump(registry, f, indent=4)
-        temp_path = Path(f.name)
-
-    # Atomic rename (POSIX guarantees atomicity)
     try:
-        temp_path.replace(path)
-    except Exception as e:
-        temp_path.unlink(missing_ok=True)
+        jsonio.write_atomic(path, registry, indent=True)
+    except OSError as e:
         raise RuntimeError(f"Failed to save registry: {e}") from e
+    finally:
+        _REGISTRY_CACHE.pop(path, None)
+
+
+# path -> (st_mtime_ns, parsed registry); reused while the file is unchanged
+_REGISTRY_CACHE: dict[Path, tuple[int, dict[str, str]]] = {}
 
 
 def load_registry(path: Path) -> dict[str, str]:
-    """Load registry with error handling"""
-    if not path.exists():
+    """Load registry with error handling, reusing the parse while the file is unchanged"""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
 
+    cached = _REGISTRY_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+
     try:
-        return json.loads(path.read_text())
-    except json.JSONDecodeError as e:
+        registry: dict[str, str] = jsonio.loads(path.read_bytes())
+    except jsonio.JSONDecodeError:
         # Registry is corrupted - back it up and start fresh
         backup = path.with_suffix(f".corrupt-{datetime.now():%Y%m%d-%H%M%S}.json")
         shutil.copy(path, backup)
         print(f"Warning: Corrupted registry backed up to {backup}")
         return {}
 
+    _REGISTRY_CACHE[path] = (mtime, registry)
+    return dict(registry)
+
 
 def setup_crash_logging() -> Path:
     """Configure crash logging for bug reports"""
@@ -297,18 +397,26 @@ def self_update(console: Console) -> None:
         raise
 
 
-async def run(api: ModrinthAPIConfig, manifest: Manifest, mods_dir: Path, index_file: Path) -> None:
+async def run(
+    api: ModrinthAPIConfig,
+    manifest: Manifest,
+    mods_dir: Path,
+    index_file: Path,
+    session: aiohttp.ClientSession | None = None,
+) -> None:
     """Download all mods with progress tracking"""
-    async with await get_api_session() as session:
-        downloader = ModDownloader(
-            api=api,
-            mc_version=manifest.minecraft,
-            loader=manifest.loader,
-            output_dir=mods_dir,
-            index_file=index_file,
-            session=session,
-        )
-        await downloader.download_all(manifest.mods)
+    if session is None:
+        return await _with_api_session(lambda s: run(api, manifest, mods_dir, index_file, s))
+
+    downloader = ModDownloader(
+        api=api,
+        mc_version=manifest.minecraft,
+        loader=manifest.loader,
+        output_dir=mods_dir,
+        index_file=index_file,
+        session=session,
+    )
+    await downloader.download_all(manifest.mods)
 
 
 async def perform_add(
@@ -318,6 +426,7 @@ async def perform_add(
     project_type: str,
     console: Console,
     manifest_file: Path,
+    session: aiohttp.ClientSession | None = None,
 ) -> None:
     """
     Search and add a project to the manifest with improved fuzzy matching.
@@ -328,89 +437,100 @@ async def perform_add(
     - Shows multiple options if the match is uncertain
     - Provides helpful feedback about what was found
     """
-    async with await get_api_session() as session:
-        url = api.search(
-            name,
-            game_versions=[manifest.minecraft],
-            loaders=[manifest.loader],
-            project_type=project_type,
+    if session is None:
+        return await _with_api_session(
+            lambda s: perform_add(api, name, manifest, project_type, console, manifest_file, s)
         )
 
-        try:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    console.print(f"[red]API request failed with status {response.status}[/red]")
-                    return
+    target_list = {
+        "mod": manifest.mods,
+        "resourcepack": manifest.resourcepacks,
+        "shaderpack": manifest.shaderpacks,
+    }.get(project_type, manifest.mods)
 
-                results = SearchResult.model_validate_json(await response.text())
-        except Exception as e:
-            console.print(f"[red]Failed to search Modrinth:[/red] {e}")
-            return
+    # An exact slug that is already listed would be the top-scoring hit anyway
+    if name in target_list:
+        console.print(f"[yellow]{name} is already in the manifest[/yellow]")
+        return
 
-        if not results or not results.hits:
-            console.print(f"[red]No {project_type} found for '{name}'[/red]")
-            console.print(f"[dim]Try searching on https://modrinth.com/mods?q={name}[/dim]")
-            return
+    url = api.search(
+        name,
+        game_versions=[manifest.minecraft],
+        loaders=[manifest.loader],
+        project_type=project_type,
+    )
 
-        # Find best match using scoring system
-        best_hit, best_score = find_best_match(name, results.hits)
-        
-        if not best_hit:
-            console.print(f"[red]No suitable match found for '{name}'[/red]")
-            return
-        
-        slug = best_hit.slug
-        
-        # Show what we found with confidence level
-        confidence_msg = ""
-        if best_score >= 80:
-            confidence_msg = "[green](high confidence match)[/green]"
-        elif best_score >= 60:
-            confidence_msg = "[yellow](medium confidence match)[/yellow]"
-        elif best_score >= 40:
-            confidence_msg = "[yellow](low confidence match)[/yellow]"
-        else:
-            confidence_msg = "[red](uncertain match - please verify)[/red]"
-        
-        console.print(f"[cyan]Found:[/cyan] {slug} {confidence_msg}")
-        
-        # If confidence is low and there are multiple results, show alternatives
-        if best_score < 60 and len(results.hits) > 1:
-            console.print("\n[yellow]Other possible matches:[/yellow]")
-            table = Table(show_header=True, header_style="bold cyan")
-            table.add_column("#", style="dim", width=3)
-            table.add_column("Slug", style="cyan")
-            table.add_column("Score", justify="right", style="dim")
-            
-            # Show top 5 alternatives
-            scored_hits = []
-            for hit in results.hits[:10]:
-                title = getattr(hit, 'title', '') or getattr(hit, 'name', '')
-                score = calculate_match_score(name, hit.slug, title)
-                scored_hits.append((hit, score))
-            
-            scored_hits.sort(key=lambda x: x[1], reverse=True)
-            
-            for idx, (hit, score) in enumerate(scored_hits[:5], 1):
-                table.add_row(str(idx), hit.slug, str(score))
-            
-            console.print(table)
-            console.print("\n[dim]Tip: Use the exact slug if the match is wrong[/dim]")
-            console.print(f"[dim]Example: ModForge-CLI add {scored_hits[1][0].slug if len(scored_hits) > 1 else 'exact-slug'}[/dim]\n")
-
-        # Add to appropriate list
-        target_list = {
-            "mod": manifest.mods,
-            "resourcepack": manifest.resourcepacks,
-            "shaderpack": manifest.shaderpacks,
-        }.get(project_type, manifest.mods)
-
-        if slug not in target_list:
-            target_list.append(slug)
-            try:
-                manifest_file.write_text(manifest.model_dump_json(indent=4))
-                console.print(f"[green]✓ Added {slug} to {project_type}s[/green]")
-            except Exception as e:
-                console.print(f"[red]Failed to save manifest:[/red] {e}")
-        else:
-            console.print(f"[yellow]{slug} is already in the manifest[/yellow]")
\ No newline at end of file
+    try:
+        async with session.get(url) as response:
+            if response.status != 200:
+                console.print(f"[red]API request failed with status {response.status}[/red]")
+                return
+
+            results = SearchResult.model_validate_json(await response.read())
+    except Exception as e:
+        console.print(f"[red]Failed to search Modrinth:[/red] {e}")
+        return
+
+    if not results or not results.hits:
+        console.print(f"[red]No {project_type} found for '{name}'[/red]")
+        console.print(f"[dim]Try searching on https://modrinth.com/mods?q={name}[/dim]")
+        return
+
+    # Find best match using scoring system
+    best_hit, best_score = find_best_match(name, results.hits)
+    
+    if not best_hit:
+        console.print(f"[red]No suitable match found for '{name}'[/red]")
+        return
+    
+    slug = best_hit.slug
+    
+    # Show what we found with confidence level
+    confidence_msg = ""
+    if best_score >= 80:
+        confidence_msg = "[green](high confidence match)[/green]"
+    elif best_score >= 60:
+        confidence_msg = "[yellow](medium confidence match)[/yellow]"
+    elif best_score >= 40:
+        confidence_msg = "[yellow](low confidence match)[/yellow]"
+    else:
+        confidence_msg = "[red](uncertain match - please verify)[/red]"
+    
+    console.print(f"[cyan]Found:[/cyan] {slug} {confidence_msg}")
+    
+    # If confidence is low and there are multiple results, show alternatives
+    if best_score < 60 and len(results.hits) > 1:
+        console.print("\n[yellow]Other possible matches:[/yellow]")
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("#", style="dim", width=3)
+        table.add_column("Slug", style="cyan")
+        table.add_column("Score", justify="right", style="dim")
+    
+        # Show top 5 alternatives
+        scored_hits = []
+        for hit in results.hits[:10]:
+            title = getattr(hit, 'title', '') or getattr(hit, 'name', '')
+            score = calculate_match_score(name, hit.slug, title)
+            scored_hits.append((hit, score))
+    
+        scored_hits.sort(key=lambda x: x[1], reverse=True)
+    
+        for idx, (hit, score) in enumerate(scored_hits[:5], 1):
+            table.add_row(str(idx), hit.slug, str(score))
+    
+        console.print(table)
+        console.print("\n[dim]Tip: Use the exact slug if the match is wrong[/dim]")
+        console.print(f"[dim]Example: ModForge-CLI add {scored_hits[1][0].slug if len(scored_hits) > 1 else 'exact-slug'}[/dim]\n")
+
+    # Add to appropriate list
+    if slug not in target_list:
+        target_list.append(slug)
+        try:
+            write_manifest(manifest_file, manifest)
+            console.print(f"[green]✓ Added {slug} to {project_type}s[/green]")
+        except Exception as e:
+            console.print(f"[red]Failed to save manifest:[/red] {e}")
+    else:
+        console.print(f"[yellow]{slug} is already in the manifest[/yellow]")
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+JSON helpers backed by orjson
+"""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+loads = orjson.loads
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+
+def write_atomic(path: Path, obj: Any, indent: bool = False) -> None:
+    """
+    Serialize obj to path via a fsynced temp file and os.replace, so readers
+    (and a crash mid-write) only ever see the old or the new file.
+    """
+    # Per-process name in the target directory: os.replace must not cross filesystems,
+    # and concurrent CLI runs must not share (and truncate) one temp file
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(dumps(obj, indent))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+__all__ = ["loads", "dumps", "write_atomic", "JSONDecodeError"]